@@ -0,0 +1,51 @@
+"""
+Benchmark comparing the per-individual Individual.decode_chromosome loop
+with the vectorized ChromosomeDecoder over a whole population.
+
+Usage: python benchmarks/bench_decode.py [population_size] [num_variables]
+"""
+import os
+import sys
+import time
+import math
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chromosome import Chromosome
+from individual import Individual
+from decoder import ChromosomeDecoder
+
+
+def main():
+    population_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_variables = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    lower_bound, upper_bound, precision = -65.536, 65.536, 0.001
+    chromosome_length = num_variables * math.ceil(math.log2((upper_bound - lower_bound) / precision))
+
+    genes = np.random.randint(0, 2, (population_size, chromosome_length)).astype(np.bool_)
+    decoder = ChromosomeDecoder(chromosome_length, num_variables, lower_bound, upper_bound)
+
+    start = time.perf_counter()
+    reference = [
+        Individual(Chromosome(chromosome_length, genes=row)).decode_chromosome(num_variables, lower_bound, upper_bound)
+        for row in genes
+    ]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = decoder.decode(genes)
+    batch_time = time.perf_counter() - start
+
+    if not np.array_equal(np.array(reference), decoded):
+        raise SystemExit("Vectorized decoder does not match Individual.decode_chromosome")
+
+    print(f"Population: {population_size}\tVariables: {num_variables}\tChromosome length: {chromosome_length}")
+    print(f"Individual.decode_chromosome:\t{loop_time * 1000:.2f} ms")
+    print(f"ChromosomeDecoder.decode:\t{batch_time * 1000:.2f} ms")
+    print(f"Speedup:\t\t\t{loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
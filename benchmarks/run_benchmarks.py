@@ -0,0 +1,213 @@
+"""
+Micro-benchmark suite timing every stage of the genetic algorithm over a grid of
+population sizes, numbers of variables and precisions.
+
+Results (best time per call, in seconds) are written to a JSON file and can be
+compared against a baseline written by an earlier run; the exit code is 1 when
+any benchmark got slower than the baseline by more than the threshold.
+Only numpy and the project's headless modules are imported (no GUI).
+
+Usage: python benchmarks/run_benchmarks.py [-o RESULTS_JSON] [--baseline BASELINE_JSON] [--threshold 0.2]
+                                           [--population-sizes N ...] [--num-variables D ...]
+                                           [--precisions P ...] [--filter TEXT] [--quick]
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bitpacking import pack_genes
+from configuration import GeneticAlgorithmConfig
+from decoder import ChromosomeDecoder
+from fitness_functions import choose_fitness_function
+from genetic_algorithm import GeneticAlgorithm
+from population import Population
+from random_streams import create_rng
+from selection_methods import select_best, roulette_wheel_selection, tournament_selection
+
+FITNESS_FUNCTIONS = ['hypersphere', 'hyperellipsoid', 'rosenbrock']
+CROSSOVER_METHODS = ['single_point', 'two_point', 'uniform', 'granular']
+MUTATION_METHODS = ['single_point', 'two_point', 'boundary', 'bit_flip']
+GENERATION_MODELS = ['variable', 'generational', 'steady_state']
+
+DEFAULT_GRID = {'population_sizes': [100, 1000], 'num_variables': [2, 20], 'precisions': [1e-3, 1e-6]}
+QUICK_GRID = {'population_sizes': [100], 'num_variables': [2], 'precisions': [1e-3]}
+
+
+def measure(function, repeat=5, min_time=0.02):
+    """
+    Best time per call of `function` in seconds. The number of calls per measurement grows
+    until one measurement takes at least min_time, then the best of `repeat` measurements is kept.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def make_config(population_size, num_variables, precision, **overrides):
+    config = GeneticAlgorithmConfig()
+    config.update_from_dict({'population_size': population_size, 'num_variables': num_variables,
+                             'precision': precision, 'seed': 0, 'progress_history': 1,
+                             # Pomiary bez logowania - mierzymy algorytm, a nie wypisywanie na konsolę
+                             'log_level': 'WARNING', 'log_interval': 0, **overrides})
+    return config
+
+
+def grid_benchmarks(population_size, num_variables, precision):
+    """
+    Benchmarks of one grid point as (name, callable) pairs.
+    """
+    config = make_config(population_size, num_variables, precision)
+    chromosome_length = GeneticAlgorithm(config).compute_chromosome_length()
+    rng = create_rng(0)
+    genes = rng.integers(0, 2, (population_size, chromosome_length), dtype=np.uint8).astype(np.bool_)
+    packed_genes = pack_genes(genes)
+    decoder = ChromosomeDecoder(chromosome_length, num_variables, config.lower_bound, config.upper_bound)
+    variables = decoder.decode(genes)
+    fitness = choose_fitness_function('hyperellipsoid')(variables)
+
+    yield 'decode', lambda: decoder.decode(genes)
+    yield 'decode_packed', lambda: decoder.decode(packed_genes)
+
+    for name in FITNESS_FUNCTIONS:
+        function = choose_fitness_function(name)
+        yield f'fitness_{name}', lambda function=function: function(variables)
+
+    num_to_select = population_size // 2
+    yield 'selection_best', lambda: select_best(fitness, num_to_select)
+    yield 'selection_tournament', lambda: tournament_selection(fitness, num_to_select, config.select_tournament_size, rng=rng)
+    for sampler in ['sus', 'alias']:
+        yield f'selection_roulette_{sampler}', lambda sampler=sampler: roulette_wheel_selection(fitness, num_to_select, sampler=sampler, rng=rng)
+
+    def population(packed=False):
+        result = Population(population_size, chromosome_length, choose_fitness_function('hyperellipsoid'), num_variables,
+                            config.lower_bound, config.upper_bound, packed=packed, rng=create_rng(0))
+        result.evaluate_fitness()
+        return result
+
+    for packed in [False, True]:
+        suffix = '_packed' if packed else ''
+        for method in CROSSOVER_METHODS:
+            crossing = population(packed)
+
+            def crossover(crossing=crossing, method=method):
+                # Krzyżowanie dokleja potomstwo - przywracamy rozmiar, aby każde wywołanie robiło to samo
+                crossing.crossover(method, 1.0)
+                crossing.genes = crossing.genes[:population_size]
+                crossing.fitness = crossing.fitness[:population_size]
+                crossing.dirty = crossing.dirty[:population_size]
+            yield f'crossover_{method}{suffix}', crossover
+
+        for method in MUTATION_METHODS:
+            mutating = population(packed)
+            probability = 1.0 / chromosome_length if method == 'bit_flip' else 1.0
+            yield f'mutation_{method}{suffix}', lambda mutating=mutating, method=method, probability=probability: mutating.mutate(method, probability)
+
+        inverting = population(packed)
+        yield f'inversion{suffix}', lambda inverting=inverting: inverting.apply_inversion(1.0)
+
+    for model in GENERATION_MODELS:
+        ga = GeneticAlgorithm(make_config(population_size, num_variables, precision, generation_model=model))
+        epochs = itertools.count()
+        yield f'iteration_{model}', lambda ga=ga, epochs=epochs: ga.iteration(next(epochs))
+
+
+def run_suite(grid, repeat=5, min_time=0.02, name_filter=None):
+    """
+    Run all benchmarks of the grid and return {benchmark_key: seconds_per_call}.
+    """
+    results = {}
+    for population_size, num_variables, precision in itertools.product(grid['population_sizes'], grid['num_variables'], grid['precisions']):
+        for name, function in grid_benchmarks(population_size, num_variables, precision):
+            key = f"{name}[pop={population_size},vars={num_variables},prec={precision:g}]"
+            if name_filter and name_filter not in key:
+                continue
+            results[key] = measure(function, repeat, min_time)
+            print(f"{key:<70}{results[key] * 1e6:>14.1f} us", flush=True)
+    return results
+
+
+def compare(baseline, results, threshold):
+    """
+    Compare results with a baseline; returns the keys slower than baseline * (1 + threshold).
+    """
+    regressions = []
+    print(f"\n{'benchmark':<70}{'baseline':>14}{'current':>14}{'ratio':>9}")
+    for key, seconds in results.items():
+        if key not in baseline:
+            continue
+        ratio = seconds / baseline[key]
+        marker = ''
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            marker = '  REGRESSION'
+        print(f"{key:<70}{baseline[key] * 1e6:>11.1f} us{seconds * 1e6:>11.1f} us{ratio:>8.2f}x{marker}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time every stage of the genetic algorithm over a parameter grid.")
+    parser.add_argument("-o", "--output", default="benchmark-results.json", help="Path of the results JSON file")
+    parser.add_argument("--baseline", help="Results JSON of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown relative to the baseline (0.2 = 20%%)")
+    parser.add_argument("--population-sizes", type=int, nargs='+', help="Population sizes of the grid")
+    parser.add_argument("--num-variables", type=int, nargs='+', help="Numbers of variables of the grid")
+    parser.add_argument("--precisions", type=float, nargs='+', help="Precisions of the grid")
+    parser.add_argument("--filter", help="Run only benchmarks whose key contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per benchmark (the best one is kept)")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Minimal duration of one measurement in seconds")
+    parser.add_argument("--quick", action="store_true", help="Use a single small grid point")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    grid = dict(QUICK_GRID if args.quick else DEFAULT_GRID)
+    for key in grid:
+        if getattr(args, key) is not None:
+            grid[key] = getattr(args, key)
+
+    results = run_suite(grid, args.repeat, args.min_time, args.filter)
+    with open(args.output, 'w') as file:
+        json.dump({
+            'metadata': {'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"), 'python': platform.python_version(),
+                         'numpy': np.__version__, 'machine': platform.machine(), 'platform': platform.platform(),
+                         'grid': grid},
+            'results': results,
+        }, file, indent=4)
+    print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
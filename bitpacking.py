@@ -0,0 +1,90 @@
+import numpy as np
+
+WORD_BITS = 64
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+def num_words(length):
+    """
+    Number of uint64 words needed to store a genome of the given bit length.
+    """
+    return -(-length // WORD_BITS)
+
+def pack_genes(genes):
+    """
+    Pack boolean genomes of shape (..., length) into uint64 words of shape (..., num_words).
+    Gene i is stored in word i // 64 at bit 63 - i % 64 (most significant bit first),
+    padding bits of the last word are always zero.
+    """
+    genes = np.asarray(genes, dtype=np.bool_)
+    words = num_words(genes.shape[-1])
+    packed = np.packbits(genes, axis=-1)
+    padding = words * 8 - packed.shape[-1]
+    if padding:
+        packed = np.concatenate((packed, np.zeros((*packed.shape[:-1], padding), dtype=np.uint8)), axis=-1)
+    return np.ascontiguousarray(packed).view('>u8').astype(np.uint64)
+
+def unpack_genes(words, length):
+    """
+    Unpack uint64 words of shape (..., num_words) back into boolean genomes of shape (..., length).
+    """
+    as_bytes = np.ascontiguousarray(np.asarray(words, dtype=np.uint64).astype('>u8')).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=-1, count=length).astype(np.bool_)
+
+def prefix_mask(points, words):
+    """
+    Word masks with the first `points` bits of the genome set, shape (*points.shape, words).
+    """
+    points = np.asarray(points, dtype=np.int64)
+    bits = np.clip(points[..., None] - WORD_BITS * np.arange(words), 0, WORD_BITS)
+    partial = ~(ALL_ONES >> np.minimum(bits, WORD_BITS - 1).astype(np.uint64))
+    return np.where(bits >= WORD_BITS, ALL_ONES, partial)
+
+def range_mask(start, stop, words):
+    """
+    Word masks with genome bits in [start, stop) set.
+    """
+    return prefix_mask(stop, words) & ~prefix_mask(start, words)
+
+def bit_mask(positions, words):
+    """
+    Word masks with only the given genome bit set, shape (*positions.shape, words).
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    word_index = positions[..., None] // WORD_BITS
+    shift = (WORD_BITS - 1 - positions[..., None] % WORD_BITS).astype(np.uint64)
+    return np.where(np.arange(words) == word_index, np.uint64(1) << shift, np.uint64(0))
+
+def flip_bits(words, rows, positions):
+    """
+    Flip single genome bits of packed genomes in place; (rows[i], positions[i]) pairs may share a word.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    shift = (WORD_BITS - 1 - positions % WORD_BITS).astype(np.uint64)
+    np.bitwise_xor.at(words, (rows, positions // WORD_BITS), np.uint64(1) << shift)
+
+def masked_crossover(parent1, parent2, mask, child1=None, child2=None):
+    """
+    Word-level crossover: child1 takes parent1's bits where mask is set, parent2's elsewhere.
+    Works on any integer or boolean arrays; children are written into child1/child2 when given.
+    """
+    inverted = ~mask
+    child1 = np.bitwise_and(parent1, mask, out=child1)
+    child1 |= parent2 & inverted
+    child2 = np.bitwise_and(parent2, mask, out=child2)
+    child2 |= parent1 & inverted
+    return child1, child2
+
+def extract_segments(words, segment_length, num_segments):
+    """
+    Read consecutive unsigned integers of `segment_length` bits (at most 64) straight from packed words.
+    Returns an array of shape (..., num_segments) with dtype uint64.
+    """
+    starts = np.arange(num_segments, dtype=np.int64) * segment_length
+    word_index = starts // WORD_BITS
+    offset = (starts % WORD_BITS).astype(np.uint64)
+    # Dodatkowe zerowe słowo, aby segment kończący się w ostatnim słowie nie wychodził poza tablicę
+    padded = np.concatenate((words, np.zeros((*words.shape[:-1], 1), dtype=np.uint64)), axis=-1)
+    high = padded[..., word_index] << offset
+    low_shift = np.uint64(WORD_BITS) - offset
+    low = np.where(offset > 0, padded[..., word_index + 1] >> np.minimum(low_shift, np.uint64(WORD_BITS - 1)), np.uint64(0))
+    return (high | low) >> np.uint64(WORD_BITS - segment_length)
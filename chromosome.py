@@ -1,10 +1,15 @@
 import numpy as np
+from random_streams import ensure_rng
 
 class Chromosome:
     # Inicjalizacja Chromosomu z binarną reprezentacją
-    def __init__(self, length):
-        # Losowe stworzenie binarnej reprzentacji chromosomu (ciąg bitów)
-        self.genes = np.random.randint(0, 2, length).astype(np.bool_)
+    def __init__(self, length, genes=None, rng=None):
+        if genes is not None:
+            # Chromosom jako lekki widok na istniejący ciąg bitów (np. wiersz tablicy populacji)
+            self.genes = genes
+        else:
+            # Losowe stworzenie binarnej reprzentacji chromosomu (ciąg bitów)
+            self.genes = ensure_rng(rng).integers(0, 2, length).astype(np.bool_)
 
     def __str__(self):
         # Reprezentacja tekstowa chromosomu jako ciąg '0' i '1'
@@ -13,20 +18,20 @@ class Chromosome:
     @staticmethod
     def from_number(number, length):
         # Tworzenie chromosomu na podstawie liczby dziesiętnej (number)
-        return Chromosome(length).set_genes(np.array(list(bin(number)[2:].zfill(length)), dtype=np.bool_))
+        return Chromosome(length, genes=np.array(list(bin(number)[2:].zfill(length)), dtype=np.bool_))
 
     def set_genes(self, gene_array):
         # Ustawianie genów chromosomu
         self.genes = gene_array
         return self
 
-    def mutate(self):
+    def mutate(self, rng=None):
         # Mutacja: odwracanie jednego losowego bitu
-        mutation_point = np.random.randint(0, len(self.genes))
+        mutation_point = ensure_rng(rng).integers(0, len(self.genes))
         self.genes[mutation_point] = not self.genes[mutation_point]
 
     def crossover(self, other, crossover_point):
         # Krzyżowanie jednopunktowe
         child1_gen = np.append(self.genes[:crossover_point], other.genes[crossover_point:])
         child2_gen = np.append(other.genes[:crossover_point], self.genes[crossover_point:])
-        return Chromosome(len(self.genes)).set_genes(child1_gen), Chromosome(len(other.genes)).set_genes(child2_gen)
\ No newline at end of file
+        return Chromosome(len(self.genes), genes=child1_gen), Chromosome(len(other.genes), genes=child2_gen)
@@ -0,0 +1,92 @@
+"""
+Headless command-line runner for the genetic algorithm.
+
+Loads a configuration saved by the GUI (config-*.json), runs the algorithm and
+writes the same results CSV as the GUI. Rows are streamed to the output as epochs
+finish, so memory stays constant for long runs. Only numpy and the standard
+library are imported, so it can run on servers without a display.
+
+Usage: python cli.py CONFIG_JSON [-o RESULTS_CSV] [--binary RESULTS_BIN] [--history-dir RUN_DIR]
+                            [--database RUNS_DB] [--epochs N] [--seed SEED]
+                            [--log-level LEVEL] [--log-interval N]
+"""
+import argparse
+import os
+import time
+from configuration import GeneticAlgorithmConfig
+from genetic_algorithm import GeneticAlgorithm
+from logger import log, set_log_level
+from results_io import load_config_json
+from results_sink import CsvResultsSink, BinaryResultsSink
+from run_history import ColumnarResultsSink
+from run_database import RunDatabase, RunDatabaseSink
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the genetic algorithm without the GUI.")
+    parser.add_argument("config", help="Path to a JSON configuration file (as saved by the GUI)")
+    parser.add_argument("-o", "--output", help="Path of the results CSV file (default: ./results/results-<timestamp>.csv)")
+    parser.add_argument("--binary", help="Also stream results to a raw float64 binary file")
+    parser.add_argument("--history-dir", help="Also store the run in the columnar format (see run_history.py)")
+    parser.add_argument("--database", help="Also store the run in an SQLite run database")
+    parser.add_argument("--epochs", type=int, help="Override the number of epochs from the configuration")
+    parser.add_argument("--seed", type=int, help="Override the random seed from the configuration (reproducible runs)")
+    parser.add_argument("--log-level", help="Log verbosity: DEBUG, INFO, WARNING, ERROR")
+    parser.add_argument("--log-interval", type=int, help="Log progress every N epochs (0 disables progress messages)")
+    parser.add_argument("--stagnation-epochs", type=int, help="Stop after N epochs without improvement of the best fitness")
+    parser.add_argument("--stagnation-tolerance", type=float, help="Smallest change of the best fitness counted as an improvement")
+    parser.add_argument("--target-fitness", type=float, help="Stop once the best fitness reaches this value")
+    parser.add_argument("--target-epsilon", type=float, help="Allowed distance from the target fitness")
+    parser.add_argument("--max-evaluations", type=int, help="Stop after this many fitness evaluations")
+    parser.add_argument("--time-budget", type=float, help="Stop after this many seconds of wall-clock time")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    config = GeneticAlgorithmConfig()
+    config_params = load_config_json(args.config)
+    config.update_from_dict(config_params)
+    if 'progress_history' not in config_params:
+        # Wyniki trafiają na bieżąco do pliku, w pamięci wystarczy ostatnia epoka
+        config.progress_history = 1
+    if args.epochs is not None:
+        config.epochs_num = args.epochs
+    if args.seed is not None:
+        config.seed = args.seed
+    if args.log_level is not None:
+        config.log_level = args.log_level
+    if args.log_interval is not None:
+        config.log_interval = args.log_interval
+    for key in ['stagnation_epochs', 'stagnation_tolerance', 'target_fitness', 'target_epsilon', 'max_evaluations', 'time_budget']:
+        if getattr(args, key) is not None:
+            setattr(config, key, getattr(args, key))
+    set_log_level(config.log_level)
+    log("Configuration:\n%s", config)
+    
+    output_path = args.output
+    if not output_path:
+        results_dir = os.path.abspath('./results')
+        os.makedirs(results_dir, exist_ok=True)
+        timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
+        output_path = os.path.join(results_dir, f"results-{timestamp}.csv")
+    
+    sinks = [CsvResultsSink(output_path, config.num_variables)]
+    if args.binary:
+        sinks.append(BinaryResultsSink(args.binary, config.num_variables))
+    if args.history_dir:
+        sinks.append(ColumnarResultsSink(args.history_dir, config))
+    database = RunDatabase(args.database) if args.database else None
+    if database:
+        sinks.append(RunDatabaseSink(database, config))
+    
+    start_time = time.time()
+    ga = GeneticAlgorithm(config, sinks=sinks)
+    ga.run()
+    log("Algorithm completed in %.2f seconds (%s)", time.time() - start_time, ga.stop_reason)
+    log("Results saved to %s", output_path)
+    if database:
+        database.close()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
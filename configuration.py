@@ -20,12 +20,50 @@ class GeneticAlgorithmConfig:
         self.selection_method = 'tournament'  # 'roulette', 'tournament' lub 'best'
         self.select_best_amount = 10 
         self.select_tournament_size = 5  # Używany tylko gdy selection_method jest 'tournament'
+        self.roulette_sampler = 'sus'  # 'sus' (stochastic universal sampling) lub 'alias'; tylko dla 'roulette'
+        self.roulette_scaling = 'linear'  # 'linear' lub 'rank'; tylko dla 'roulette'
 
         self.crossover_method = 'single_point'  # 'single_point', 'two_point', 'uniform', 'granular'
-        self.mutation_method = 'single_point'  # 'single_point', 'two_point', 'boundary'
+        self.mutation_method = 'single_point'  # 'single_point', 'two_point', 'boundary', 'bit_flip' (prawdopodobieństwo na bit)
+
+        # Model pokoleń: 'variable' (rozmiar zmienia się co epokę), 'generational' (stały rozmiar, dwa bufory)
+        # lub 'steady_state' (w każdej epoce potomstwo zastępuje steady_state_replacement najgorszych osobników)
+        self.generation_model = 'variable'
+        self.steady_state_replacement = 2
 
         # Czy algorytm ma maksymalizować (True) czy minimalizować (False) funkcje fitness
         self.maximization = False
+
+        # Przechowywanie genomów spakowanych w słowach uint64 (8x mniej pamięci dla dużych populacji)
+        self.packed_genomes = False
+
+        # Maksymalna liczba wartości fitness w cache LRU kluczowanym genomem (0 wyłącza cache)
+        self.fitness_cache_size = 0
+
+        # Backend oceny funkcji fitness: 'serial' lub 'process' (pula procesów utrzymywana między epokami)
+        self.evaluator = 'serial'
+        self.workers = None  # Liczba procesów roboczych (None = liczba rdzeni)
+        self.chunk_size = None  # Liczba wierszy wysyłanych do procesu naraz (None = równy podział)
+
+        # Kryteria wcześniejszego zatrzymania (0 lub None wyłącza kryterium):
+        # brak poprawy najlepszego wyniku o więcej niż stagnation_tolerance przez stagnation_epochs epok,
+        # osiągnięcie target_fitness z dokładnością target_epsilon, limit ocen funkcji fitness i limit czasu w sekundach
+        self.stagnation_epochs = 0
+        self.stagnation_tolerance = 0.0
+        self.target_fitness = None
+        self.target_epsilon = 0.0
+        self.max_evaluations = None
+        self.time_budget = None
+
+        # Ziarno generatora liczb losowych (None = losowe ziarno, każde uruchomienie inne)
+        self.seed = None
+
+        # Poziom logowania ('DEBUG', 'INFO', 'WARNING', ...) i co ile epok logowany jest postęp (0 = wcale)
+        self.log_level = 'INFO'
+        self.log_interval = 1
+
+        # Historia postępu w pamięci: None = wszystkie epoki, N = bufor cykliczny N ostatnich epok
+        self.progress_history = None
         
     def update_from_dict(self, params):
         for k, v in params.items():
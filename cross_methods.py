@@ -1,49 +1,89 @@
 import numpy as np
+from random_streams import ensure_rng
+from bitpacking import num_words, pack_genes, prefix_mask, range_mask, masked_crossover
 from chromosome import Chromosome
 
-def single_point_crossover(parent1, parent2):
+def single_point_crossover(parent1, parent2, rng=None):
     """
     Single-point crossover between two chromosomes.
     """
-    crossover_point = np.random.randint(1, len(parent1.genes) - 1)
-    child1_genes = np.concatenate((parent1.genes[:crossover_point], parent2.genes[crossover_point:]))
-    child2_genes = np.concatenate((parent2.genes[:crossover_point], parent1.genes[crossover_point:]))
-    return Chromosome(len(parent1.genes)).set_genes(child1_genes), Chromosome(len(parent2.genes)).set_genes(child2_genes)
+    return _chromosome_crossover('single_point', parent1, parent2, rng=rng)
 
-def two_point_crossover(parent1, parent2):
+def two_point_crossover(parent1, parent2, rng=None):
     """
     Two-point crossover between two chromosomes.
     """
-    points = np.sort(np.random.choice(range(1, len(parent1.genes) - 1), 2, replace=False))
-    child1_genes = np.concatenate((parent1.genes[:points[0]], parent2.genes[points[0]:points[1]], parent1.genes[points[1]:]))
-    child2_genes = np.concatenate((parent2.genes[:points[0]], parent1.genes[points[0]:points[1]], parent2.genes[points[1]:]))
-    return Chromosome(len(parent1.genes)).set_genes(child1_genes), Chromosome(len(parent2.genes)).set_genes(child2_genes)
+    return _chromosome_crossover('two_point', parent1, parent2, rng=rng)
 
-def uniform_crossover(parent1, parent2):
+def uniform_crossover(parent1, parent2, rng=None):
     """
     Uniform crossover, where each gene is randomly chosen from one of the parents.
     """
-    mask = np.random.rand(len(parent1.genes)) > 0.5
-    child1_genes = np.where(mask, parent1.genes, parent2.genes)
-    child2_genes = np.where(mask, parent2.genes, parent1.genes)
-    return Chromosome(len(parent1.genes)).set_genes(child1_genes), Chromosome(len(parent2.genes)).set_genes(child2_genes)
+    return _chromosome_crossover('uniform', parent1, parent2, rng=rng)
 
-def granular_crossover(parent1, parent2, granularity=5):
+def granular_crossover(parent1, parent2, granularity=5, rng=None):
     """
     Granular crossover, where blocks of genes are chosen from parents.
     Each block's length is determined by granularity.
     """
-    num_blocks = len(parent1.genes) // granularity
-    mask = np.random.rand(num_blocks) > 0.5
-    child1_genes = []
-    child2_genes = []
-    for i in range(num_blocks):
-        start_idx = i * granularity
-        end_idx = start_idx + granularity
-        if mask[i]:
-            child1_genes.extend(parent1.genes[start_idx:end_idx])
-            child2_genes.extend(parent2.genes[start_idx:end_idx])
-        else:
-            child1_genes.extend(parent2.genes[start_idx:end_idx])
-            child2_genes.extend(parent1.genes[start_idx:end_idx])
-    return Chromosome(len(parent1.genes)).set_genes(np.array(child1_genes)), Chromosome(len(parent2.genes)).set_genes(np.array(child2_genes))
\ No newline at end of file
+    return _chromosome_crossover('granular', parent1, parent2, granularity, rng)
+
+def _chromosome_crossover(method, parent1, parent2, granularity=5, rng=None):
+    # Para chromosomów jako jednoelementowa partia dla operatorów wsadowych
+    length = len(parent1.genes)
+    mask = crossover_masks(method, 1, length, granularity, rng)[0]
+    child1_genes, child2_genes = masked_crossover(np.asarray(parent1.genes), np.asarray(parent2.genes), mask)
+    return Chromosome(length, genes=child1_genes), Chromosome(length, genes=child2_genes)
+
+
+# Krzyżowanie wsadowe: dla wszystkich par naraz losowane są maski mówiące, które geny dziecko 1 bierze od rodzica 1.
+# Te same maski działają na genomach bitowych (bool) i spakowanych (uint64) - patrz masked_crossover.
+
+def crossover_masks(method, count, length, granularity=5, rng=None):
+    """
+    Boolean crossover masks of shape (count, length) for a batch of parent pairs.
+    """
+    rng = ensure_rng(rng)
+    positions = np.arange(length)
+    if method == 'single_point':
+        points = rng.integers(1, length - 1, count)
+        return positions < points[:, None]
+    elif method == 'two_point':
+        start, stop = _two_points(count, length, rng)
+        return (positions < start[:, None]) | (positions >= stop[:, None])
+    elif method == 'uniform':
+        return rng.random((count, length)) > 0.5
+    elif method == 'granular':
+        return _granular_masks(count, length, granularity, rng)
+    raise ValueError(f"Unknown crossover method: {method}")
+
+def packed_crossover_masks(method, count, length, granularity=5, rng=None):
+    """
+    Crossover masks for a batch of bit-packed parent pairs, shape (count, num_words).
+    Cut-point masks are built directly from words; random masks are packed.
+    """
+    rng = ensure_rng(rng)
+    words = num_words(length)
+    if method == 'single_point':
+        return prefix_mask(rng.integers(1, length - 1, count), words)
+    elif method == 'two_point':
+        return ~range_mask(*_two_points(count, length, rng), words)
+    elif method == 'uniform':
+        return pack_genes(rng.random((count, length)) > 0.5)
+    elif method == 'granular':
+        return pack_genes(_granular_masks(count, length, granularity, rng))
+    raise ValueError(f"Unknown crossover method: {method}")
+
+def _two_points(count, length, rng):
+    # Dwa różne punkty z przedziału [1, length - 2], posortowane
+    first = rng.integers(1, length - 1, count)
+    second = rng.integers(1, length - 2, count)
+    second += second >= first
+    return np.minimum(first, second), np.maximum(first, second)
+
+def _granular_masks(count, length, granularity, rng):
+    # Wybór bloku rozszerzony na geny przez np.repeat; niepełny ostatni blok zostaje po rodzicu
+    num_blocks = length // granularity
+    masks = np.ones((count, length), dtype=np.bool_)
+    masks[:, :num_blocks * granularity] = np.repeat(rng.random((count, num_blocks)) > 0.5, granularity, axis=1)
+    return masks
@@ -0,0 +1,51 @@
+import numpy as np
+from bitpacking import WORD_BITS, extract_segments, unpack_genes
+
+class ChromosomeDecoder:
+    """
+    Vectorized decoder turning binary genomes into real-valued variables.
+
+    The power-of-two weights and the scale factor are computed once per
+    configuration, so decoding the whole population is a single matrix product.
+    Results are identical to Individual.decode_chromosome as long as a variable
+    segment fits in 53 bits (the float64 mantissa).
+    """
+
+    def __init__(self, chromosome_length, num_variables, begin_range, end_range):
+        self.chromosome_length = chromosome_length
+        self.num_variables = num_variables
+        self.segment_length = chromosome_length // num_variables
+        self.begin_range = begin_range
+        self.end_range = end_range
+        self.span = end_range - begin_range
+        self.max_dec_value = 2 ** self.segment_length - 1
+
+        # Wagi kolejnych bitów segmentu (najstarszy bit pierwszy), tak jak w pętli total * 2 + gene
+        exponents = np.arange(self.segment_length - 1, -1, -1)
+        if self.segment_length < 63:
+            self.weights = np.left_shift(np.int64(1), exponents.astype(np.int64))
+        else:
+            # Zbyt długie segmenty dla int64 - wagi zmiennoprzecinkowe (wynik przybliżony)
+            self.weights = np.power(2.0, exponents)
+
+    def decode(self, genes):
+        """
+        Decode genomes of shape (..., chromosome_length) into variables of shape (..., num_variables).
+        Bit-packed genomes (uint64 words, see bitpacking.py) are decoded straight from the words.
+        """
+        genes = np.asarray(genes)
+        if genes.dtype == np.uint64:
+            return self.decode_packed(genes)
+        used_length = self.num_variables * self.segment_length
+        segments = genes[..., :used_length].reshape(*genes.shape[:-1], self.num_variables, self.segment_length)
+        totals = segments.astype(self.weights.dtype) @ self.weights
+        return self.begin_range + (totals / self.max_dec_value) * self.span
+
+    def decode_packed(self, words):
+        """
+        Decode bit-packed genomes of shape (..., num_words) into variables of shape (..., num_variables).
+        """
+        if self.segment_length > WORD_BITS:
+            return self.decode(unpack_genes(words, self.chromosome_length))
+        totals = extract_segments(words, self.segment_length, self.num_variables)
+        return self.begin_range + (totals / self.max_dec_value) * self.span
@@ -0,0 +1,108 @@
+import os
+import pickle
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from logger import log
+from random_streams import seed_global_random
+
+# Rozmiar bloku wierszy z własnym ziarnem - stały, więc wyniki nie zależą od liczby procesów ani chunk_size
+SEED_BLOCK_ROWS = 1024
+
+def create_evaluator(name, fitness_function, workers=None, chunk_size=None, seed=None):
+    """
+    Create the fitness evaluation backend based on the given name ('serial' or 'process').
+    Falls back to serial evaluation when the fitness function cannot be sent to worker processes.
+    With a `seed` (a SeedSequence) every block of SEED_BLOCK_ROWS rows is evaluated with the global
+    np.random state seeded from its own child seed, so stochastic fitness functions give the same
+    results for a seeded run in both backends, whatever the number of workers and chunk size.
+    """
+    if name == 'serial':
+        return SerialEvaluator(fitness_function, seed)
+    elif name == 'process':
+        workers = int(workers) if workers else os.cpu_count() or 1
+        if workers <= 1:
+            return SerialEvaluator(fitness_function, seed)
+        try:
+            pickle.dumps(fitness_function)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            log("Fitness function cannot be pickled, falling back to serial evaluation")
+            return SerialEvaluator(fitness_function, seed)
+        return ProcessPoolEvaluator(fitness_function, workers, int(chunk_size) if chunk_size else None, seed)
+    else:
+        raise ValueError(f"Unknown evaluator: {name}")
+
+def _evaluate_seeded_blocks(fitness_function, seeds, variables):
+    # Każdy blok SEED_BLOCK_ROWS wierszy z własnym ziarnem; globalny stan np.random wywołującego jest przywracany
+    state = np.random.get_state()
+    try:
+        results = []
+        for index, seed in enumerate(seeds):
+            seed_global_random(seed)
+            block = variables[index * SEED_BLOCK_ROWS:(index + 1) * SEED_BLOCK_ROWS]
+            results.append(np.asarray(fitness_function(block), dtype=np.float64))
+    finally:
+        np.random.set_state(state)
+    return np.concatenate(results) if results else np.empty(0)
+
+def _num_blocks(rows):
+    return -(-rows // SEED_BLOCK_ROWS)
+
+class SerialEvaluator:
+    """
+    Evaluates the batch fitness function in the calling process.
+    """
+
+    def __init__(self, fitness_function, seed=None):
+        self.fitness_function = fitness_function
+        self.seed = seed
+
+    def __call__(self, variables):
+        if self.seed is None:
+            return self.fitness_function(variables)
+        return _evaluate_seeded_blocks(self.fitness_function, self.seed.spawn(_num_blocks(len(variables))), variables)
+
+    def close(self):
+        pass
+
+class ProcessPoolEvaluator:
+    """
+    Evaluates chunks of decoded variables in a ProcessPoolExecutor.
+    The pool is started on first use and kept alive across epochs until close().
+    Chunks are split by rows only, so results are identical to serial evaluation; with a seed,
+    chunks are whole seed blocks, so this also holds for stochastic fitness functions.
+    """
+
+    def __init__(self, fitness_function, workers, chunk_size=None, seed=None):
+        self.fitness_function = fitness_function
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.executor = None
+
+    def __call__(self, variables):
+        chunk_size = self.chunk_size or -(-len(variables) // self.workers)
+        seeds = None
+        if self.seed is not None:
+            chunk_size = _num_blocks(chunk_size) * SEED_BLOCK_ROWS
+            seeds = self.seed.spawn(_num_blocks(len(variables)))
+        if len(variables) <= chunk_size:
+            # Jeden fragment - wysyłanie do innego procesu tylko by dodało narzut
+            if seeds is not None:
+                return _evaluate_seeded_blocks(self.fitness_function, seeds, variables)
+            return self.fitness_function(variables)
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        chunks = [variables[start:start + chunk_size] for start in range(0, len(variables), chunk_size)]
+        if seeds is not None:
+            blocks_per_chunk = chunk_size // SEED_BLOCK_ROWS
+            results = self.executor.map(_evaluate_seeded_blocks, [self.fitness_function] * len(chunks),
+                                        [seeds[start:start + blocks_per_chunk] for start in range(0, len(seeds), blocks_per_chunk)],
+                                        chunks)
+        else:
+            results = self.executor.map(self.fitness_function, chunks)
+        return np.concatenate([np.asarray(result, dtype=np.float64) for result in results])
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+class FitnessCache:
+    """
+    Bounded LRU cache of fitness values keyed by the genome's byte content.
+    The least recently used entry is evicted once max_size entries are stored.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key):
+        """Return the cached fitness for a genome key, or None when it is not cached."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def store(self, key, value):
+        """Store a fitness value, evicting the least recently used entries if needed."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self):
+        return f"Cache hits: {self.hits}, misses: {self.misses} ({self.hit_rate:.1%}), size: {len(self)}/{self.max_size}"
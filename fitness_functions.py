@@ -1,7 +1,13 @@
+import numpy as np
+
 def choose_fitness_function(name):
     """
     Choose the fitness function based on the given name.
+    Returned callables take decoded variables of shape (N, D) and return an N-vector.
+    A user-supplied callable may be passed instead of a name; scalar ones are wrapped.
     """
+    if callable(name):
+        return as_batch_fitness_function(name)
     if name == 'hyperellipsoid':
         return hyperellipsoid_function
     elif name == 'hypersphere':
@@ -11,20 +17,55 @@ def choose_fitness_function(name):
     else:
         raise ValueError(f"Unknown fitness function: {name}")
 
+def batch_fitness_function(function):
+    """
+    Mark a fitness function as batch-aware, i.e. operating on (N, D) matrices.
+    """
+    function.is_batch = True
+    return function
+
+def as_batch_fitness_function(function):
+    """
+    Return the function unchanged if it is batch-aware, otherwise wrap it.
+    """
+    return function if getattr(function, 'is_batch', False) else ScalarFitnessFunction(function)
+
+class ScalarFitnessFunction:
+    """
+    Adapter running a scalar fitness function (list of variables -> value) row by row.
+    Kept as a class so that wrapped functions stay picklable.
+    """
+    is_batch = True
+
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, x):
+        x = np.asarray(x)
+        if x.ndim == 1:
+            return self.function(x.tolist())
+        return np.fromiter((self.function(row) for row in x.tolist()), dtype=np.float64, count=len(x))
+
+@batch_fitness_function
 def hypersphere(x):
     """
     Fitness function for the hypersphere problem.
     """
-    return sum(xi ** 2 for xi in x)
+    x = np.asarray(x)
+    return np.sum(x ** 2, axis=-1)
 
+@batch_fitness_function
 def hyperellipsoid_function(x):
     """
     Fitness function for the hyperellipsoid problem.
     """
-    return sum(xi ** 2 for xi in x)
+    x = np.asarray(x)
+    return np.sum(x ** 2, axis=-1)
 
+@batch_fitness_function
 def rosenbrock_function(x):
     """
     Fitness function for the Rosenbrock's valley (banana function).
     """
-    return sum(100 * (x[i + 1] - x[i] ** 2) ** 2 + (1 - x[i]) ** 2 for i in range(len(x) - 1))
\ No newline at end of file
+    x = np.asarray(x)
+    return np.sum(100 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2, axis=-1)
@@ -62,9 +62,55 @@ class ConfigForm(QWidget):
         self.maximization_check = QCheckBox(self)
         pop_layout.addRow(QLabel('Maximization:'), self.maximization_check)
         
+        self.generation_model_combo = QComboBox(self)
+        self.generation_model_combo.addItems(['variable', 'generational', 'steady_state'])
+        pop_layout.addRow(QLabel('Generation Model:'), self.generation_model_combo)
+        
+        self.steady_state_replacement_spin = QSpinBox(self)
+        self.steady_state_replacement_spin.setRange(1, 1000)
+        self.steady_state_replacement_spin.setValue(2)
+        pop_layout.addRow(QLabel('Steady-State Replacement:'), self.steady_state_replacement_spin)
+        
+        self.seed_input = QLineEdit(self)
+        self.seed_input.setPlaceholderText("random")
+        pop_layout.addRow(QLabel('Random Seed:'), self.seed_input)
+        
         pop_group.setLayout(pop_layout)
         left_column.addWidget(pop_group)
         
+        # Stopping criteria (0 or an empty field disables a criterion)
+        stop_group = QGroupBox("Stopping Criteria")
+        stop_layout = QFormLayout()
+        
+        self.stagnation_epochs_spin = QSpinBox(self)
+        self.stagnation_epochs_spin.setRange(0, 10000)
+        self.stagnation_epochs_spin.setValue(0)
+        self.stagnation_epochs_spin.setSpecialValueText("off")
+        stop_layout.addRow(QLabel('Stagnation Epochs:'), self.stagnation_epochs_spin)
+        
+        self.stagnation_tolerance_input = QLineEdit(self)
+        self.stagnation_tolerance_input.setText("0.0")
+        stop_layout.addRow(QLabel('Stagnation Tolerance:'), self.stagnation_tolerance_input)
+        
+        self.target_fitness_input = QLineEdit(self)
+        self.target_fitness_input.setPlaceholderText("none")
+        stop_layout.addRow(QLabel('Target Fitness:'), self.target_fitness_input)
+        
+        self.target_epsilon_input = QLineEdit(self)
+        self.target_epsilon_input.setText("0.0")
+        stop_layout.addRow(QLabel('Target Epsilon:'), self.target_epsilon_input)
+        
+        self.max_evaluations_input = QLineEdit(self)
+        self.max_evaluations_input.setPlaceholderText("none")
+        stop_layout.addRow(QLabel('Max Evaluations:'), self.max_evaluations_input)
+        
+        self.time_budget_input = QLineEdit(self)
+        self.time_budget_input.setPlaceholderText("none")
+        stop_layout.addRow(QLabel('Time Budget [s]:'), self.time_budget_input)
+        
+        stop_group.setLayout(stop_layout)
+        left_column.addWidget(stop_group)
+        
         # Create right column
         right_column = QVBoxLayout()
         
@@ -123,7 +169,7 @@ class ConfigForm(QWidget):
         methods_layout.addRow(QLabel('Crossover Method:'), self.crossover_method_combo)
         
         self.mutation_method_combo = QComboBox(self)
-        self.mutation_method_combo.addItems(['single_point', 'two_point', 'boundary'])
+        self.mutation_method_combo.addItems(['single_point', 'two_point', 'boundary', 'bit_flip'])
         methods_layout.addRow(QLabel('Mutation Method:'), self.mutation_method_combo)
         
         methods_group.setLayout(methods_layout)
@@ -175,6 +221,17 @@ def get_config_params_from_gui(form):
     params['epochs_num'] = form.epochs_num_spin.value()
     params['elite_strategy_amount'] = form.elite_amount_spin.value()
     params['maximization'] = form.maximization_check.isChecked()
+    params['generation_model'] = form.generation_model_combo.currentText()
+    params['steady_state_replacement'] = form.steady_state_replacement_spin.value()
+    params['seed'] = int(form.seed_input.text()) if form.seed_input.text().strip() else None
+    
+    # Parse stopping criteria
+    params['stagnation_epochs'] = form.stagnation_epochs_spin.value()
+    params['stagnation_tolerance'] = float(form.stagnation_tolerance_input.text() or 0.0)
+    params['target_fitness'] = float(form.target_fitness_input.text()) if form.target_fitness_input.text().strip() else None
+    params['target_epsilon'] = float(form.target_epsilon_input.text() or 0.0)
+    params['max_evaluations'] = int(form.max_evaluations_input.text()) if form.max_evaluations_input.text().strip() else None
+    params['time_budget'] = float(form.time_budget_input.text()) if form.time_budget_input.text().strip() else None
     
     # Parse genetic operations
     params['crossover_probability'] = form.crossover_prob_spin.value()
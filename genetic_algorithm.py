@@ -1,21 +1,61 @@
 from population import Population
 from fitness_functions import choose_fitness_function
-from logger import log
+from evaluators import create_evaluator
+from random_streams import seed_sequence, create_rng
+from phase_timer import PhaseTimer, format_timing_summary
+from stopping import StoppingCriteria
+from logger import log, set_log_level, is_enabled
 import math
+from collections import deque
 
 class GeneticAlgorithm:
-    def __init__(self, config):
+    def __init__(self, config, sinks=None, seed=None):
         self.config = config
+        set_log_level(config.log_level)
+        # Results sinks receiving every epoch's row as soon as it is reported (see results_sink.py)
+        self.sinks = list(sinks or [])
+        # Random stream of this run (PCG64) seeded from config.seed, unless a seed or SeedSequence is given explicitly;
+        # child streams for islands and fitness evaluation are spawned from the same SeedSequence
+        self.seed_sequence = seed_sequence(config.seed if seed is None else seed)
+        self.rng = create_rng(self.seed_sequence)
         self.fitness_function = choose_fitness_function(config.fitness_function)
+        # Ziarna bloków oceny tylko dla uruchomień z ziarnem - bez niego bloki byłyby zbędnym narzutem
+        seeded = config.seed is not None or seed is not None
+        self.evaluator = create_evaluator(config.evaluator, self.fitness_function, config.workers, config.chunk_size,
+                                          seed=self.spawn_seeds(1)[0] if seeded else None)
         self.population = Population(config.population_size,
                                      self.compute_chromosome_length(),
                                      self.fitness_function,
                                      config.num_variables,
                                      config.lower_bound,
-                                     config.upper_bound)
+                                     config.upper_bound,
+                                     packed=config.packed_genomes,
+                                     fitness_cache_size=config.fitness_cache_size,
+                                     evaluator=self.evaluator,
+                                     maximization=config.maximization,
+                                     rng=self.rng)
         self.optimum = float('inf') if not config.maximization else float('-inf')
         self.optimum_variables = None
-        self.progress_data = []
+        self.progress_data = self.create_progress_data()
+        self.last_epoch_data = None
+        # Rodzice wybrani w bieżącej epoce i wiersze potomstwa (None = cała populacja, model 'variable')
+        self.parents = None
+        self.offspring_rows = None
+        # Czasy poszczególnych faz iteracji (łącznie, w ostatniej epoce i liczba wywołań)
+        self.timer = PhaseTimer()
+        # Kryteria wcześniejszego zatrzymania i powód zakończenia ostatniego uruchomienia
+        self.stopping = StoppingCriteria(config)
+        self.stop_reason = None
+
+    def create_progress_data(self):
+        """Create in-memory progress storage: a full list, or a ring buffer of the last N epochs."""
+        if self.config.progress_history is None:
+            return []
+        return deque(maxlen=int(self.config.progress_history))
+
+    def spawn_seeds(self, count):
+        """Independent child SeedSequences of this run, e.g. for islands or worker processes."""
+        return self.seed_sequence.spawn(count)
 
     def compute_chromosome_length(self):
         """Compute chromosome length based on number of variables and precision required."""
@@ -24,24 +64,67 @@ class GeneticAlgorithm:
     def run(self):
         """Run the genetic algorithm process for a set number of epochs."""
         # Clear any previous progress data
-        self.progress_data = []
+        self.progress_data = self.create_progress_data()
+        self.timer = PhaseTimer()
+        self.stopping.reset()
         
-        for epoch in range(self.config.epochs_num):
-            self.iteration(epoch)
+        try:
+            stop_reason = 'epochs'
+            for epoch in range(self.config.epochs_num):
+                self.iteration(epoch)
+                reason = self.check_stop()
+                if reason is not None:
+                    stop_reason = reason
+                    break
+            self.finish(stop_reason)
+        finally:
+            self.close()
         
-        log(f"Found optimum: [{self.optimum}, {self.optimum_variables}]")
+        log("Found optimum: [%s, %s]", self.optimum, self.optimum_variables)
+        if self.population.fitness_cache is not None:
+            log("Fitness %s", self.population.fitness_cache)
+        self.log_timing()
         
         # Return the progress data for all epochs
         return self.progress_data
 
+    def check_stop(self):
+        """Check the early stopping criteria after an epoch; returns the stop reason or None to continue."""
+        return self.stopping.check(self.optimum, self.population.evaluations)
+
+    def finish(self, stop_reason):
+        """Record why the run ended ('epochs', 'target', 'stagnation', 'max_evaluations', 'time_budget', 'cancelled')."""
+        self.stop_reason = stop_reason
+        for sink in self.sinks:
+            sink.set_metadata('stop_reason', stop_reason)
+        epochs = self.last_epoch_data[0] if self.last_epoch_data is not None else 0
+        log("Stopped after %d epochs: %s", epochs, stop_reason)
+
+    def close(self):
+        """Release resources held by the evaluation backend (e.g. worker processes) and flush the results sinks."""
+        self.evaluator.close()
+        for sink in self.sinks:
+            sink.close()
+
     def iteration(self, epoch):
-        """Execute a single iteration (epoch) of the genetic algorithm."""
-        self.evaluate_fitness()
-        self.report(epoch)
-        self.selection()
-        self.crossover()
-        self.mutate()
-        self.inversion()
+        """Execute a single iteration (epoch) of the genetic algorithm, timing each phase."""
+        timer = self.timer
+        timer.start_epoch()
+        timer.measure('evaluate', self.evaluate_fitness)
+        timer.measure('report', self.report, epoch)
+        timer.measure('selection', self.selection)
+        timer.measure('crossover', self.crossover)
+        timer.measure('mutate', self.mutate)
+        timer.measure('inversion', self.inversion)
+
+    def timing_summary(self):
+        """Per-phase timing data (see PhaseTimer.summary) including fitness evaluations per second."""
+        return self.timer.summary(self.population.evaluations)
+
+    def log_timing(self):
+        """Write the per-phase timing breakdown to the log."""
+        if is_enabled():
+            log(format_timing_summary(self.timing_summary()))
         
     def evaluate_fitness(self):
         """Evaluate the fitness of each individual in the population."""
@@ -49,47 +132,66 @@ class GeneticAlgorithm:
     
     def report(self, epoch):
         """Report the results of the current epoch and save progress data."""
-        best_individual = self.get_best()
-        current_best_fitness = best_individual.fitness
-        
-        # Update the optimum if this epoch's best is better
-        if self.config.maximization:
-            if current_best_fitness > self.optimum:
-                self.optimum = current_best_fitness
-                self.optimum_variables = best_individual.decode_chromosome(self.config.num_variables, self.config.lower_bound, self.config.upper_bound)
-        else:
-            if current_best_fitness < self.optimum:
-                self.optimum = current_best_fitness
-                self.optimum_variables = best_individual.decode_chromosome(self.config.num_variables, self.config.lower_bound, self.config.upper_bound)
-        
-        # Get current best variables
-        current_best_variables = best_individual.decode_chromosome(self.config.num_variables, self.config.lower_bound, self.config.upper_bound)
+        # Best-of-generation and best-ever are tracked (and decoded) once during evaluation
+        current_best_fitness = self.population.best_fitness
+        current_best_variables = self.population.best_variables
+        self.optimum = self.population.best_ever_fitness
+        self.optimum_variables = self.population.best_ever_variables
         
         # Create epoch data row:
         # [epoch_number, population_size, current_best_fitness, x1, x2, ..., best_fitness_all_time]
-        epoch_data = [epoch + 1, len(self.population.individuals), current_best_fitness, *current_best_variables, self.optimum, *self.optimum_variables]
+        epoch_data = [epoch + 1, self.population.size, current_best_fitness, *current_best_variables, self.optimum, *self.optimum_variables]
         
-        # Store the data for this epoch
+        # Store the data for this epoch and stream it to the sinks
+        self.last_epoch_data = epoch_data
         self.progress_data.append(epoch_data)
+        for sink in self.sinks:
+            sink.write(epoch_data)
         
-        log(f"Epoch {epoch + 1}\tPopulation: {len(self.population.individuals)}\tBest Fitness: {current_best_fitness}")
+        # Postęp logowany co log_interval epok; argumenty formatowane dopiero gdy wpis faktycznie powstaje
+        interval = self.config.log_interval
+        if interval and (epoch + 1) % interval == 0:
+            cache = self.population.fitness_cache
+            if cache is None:
+                log("Epoch %d\tPopulation: %d\tBest Fitness: %s", epoch + 1, self.population.size, current_best_fitness)
+            else:
+                log("Epoch %d\tPopulation: %d\tBest Fitness: %s\tCache hits: %d\tCache misses: %d",
+                    epoch + 1, self.population.size, current_best_fitness, cache.hits, cache.misses)
     
     def get_best(self):
-        """Returns the best individual from the population."""
-        return max(self.population.individuals, key=lambda ind: ind.fitness) if self.config.maximization else min(self.population.individuals, key=lambda ind: ind.fitness)
+        """Returns the best individual from the population (as of the last evaluation)."""
+        return self.population.best_individual()
     
     def selection(self):
         """Perform selection process as per the method defined in configuration."""
-        self.population.selection(self.config.selection_method, self.config.select_best_amount, self.config.select_tournament_size, self.config.maximization)
+        if self.config.generation_model == 'variable':
+            self.population.selection(self.config.selection_method, self.config.select_best_amount, self.config.select_tournament_size, self.config.maximization,
+                                      self.config.roulette_sampler, self.config.roulette_scaling)
+        else:
+            # Przy stałym rozmiarze populacji selekcja wybiera tylko pulę rodziców
+            self.parents = self.population.selection_indices(self.config.selection_method, self.config.select_best_amount,
+                                                             self.config.select_tournament_size, self.config.maximization,
+                                                             self.config.roulette_sampler, self.config.roulette_scaling)
     
     def crossover(self):
         """Perform crossover across the population members, based on probability."""
-        self.population.crossover(self.config.crossover_method, self.config.crossover_probability)
+        model = self.config.generation_model
+        if model == 'variable':
+            self.population.crossover(self.config.crossover_method, self.config.crossover_probability)
+            self.offspring_rows = None
+        elif model == 'generational':
+            self.offspring_rows = self.population.next_generation(self.parents, self.config.crossover_method, self.config.crossover_probability,
+                                                                  self.config.elite_strategy_amount, self.config.maximization)
+        elif model == 'steady_state':
+            self.offspring_rows = self.population.replace_worst(self.parents, self.config.steady_state_replacement, self.config.crossover_method,
+                                                                self.config.crossover_probability, self.config.maximization)
+        else:
+            raise ValueError(f"Unknown generation model: {model}")
     
     def mutate(self):
-        """Mutate the population members, based on probability."""
-        self.population.mutate(self.config.mutation_method, self.config.mutation_probability)
+        """Mutate the population members (only the new offspring in fixed-size models), based on probability."""
+        self.population.mutate(self.config.mutation_method, self.config.mutation_probability, self.offspring_rows)
     
     def inversion(self):
         """Apply inversion operation to the population members, based on probability."""
-        self.population.apply_inversion(self.config.inversion_probability)
+        self.population.apply_inversion(self.config.inversion_probability, self.offspring_rows)
@@ -1,24 +1,47 @@
 import numpy as np
+from random_streams import ensure_rng
+from bitpacking import pack_genes, unpack_genes
 
-def inversion(chromosome):
+def inversion(chromosome, rng=None):
     """
     Performs inversion mutation on a chromosome. It selects two random points, 
-    slicing the chromosome into three parts, then reverses the middle part and reassembles the chromosome.
+    slicing the chromosome into three parts, then reverses the middle part in place.
     """
-    length = len(chromosome.genes)
-    if length < 3:
+    if len(chromosome.genes) < 3:
         return  # Too short to invert meaningfully
-    
-    # Select two unique points for slicing the chromosome, ensuring they are not on the boundary.
-    point1, point2 = sorted(np.random.choice(range(1, length - 1), 2, replace=False))
-    
-    # Break chromosome into three parts
-    left = chromosome.genes[:point1]
-    middle = chromosome.genes[point1:point2]
-    right = chromosome.genes[point2:]
-    
-    # Reverse the middle section
-    middle = middle[::-1]
-    
-    # Reassemble the chromosome
-    chromosome.set_genes(np.concatenate([left, middle, right]))
\ No newline at end of file
+    # Chromosom jako jednowierszowa tablica (widok), odwracany przez operator wsadowy
+    batch_inversion(chromosome.genes[None, :], np.zeros(1, dtype=np.intp), rng)
+
+def inversion_indices(count, length, rng=None):
+    """
+    Gene index maps of shape (count, length) reversing a random segment [point1, point2) of each row,
+    with two distinct points drawn from [1, length - 2].
+    """
+    rng = ensure_rng(rng)
+    first = rng.integers(1, length - 1, count)
+    second = rng.integers(1, length - 2, count)
+    second += second >= first
+    point1 = np.minimum(first, second)[:, None]
+    point2 = np.maximum(first, second)[:, None]
+    positions = np.arange(length)
+    inside = (positions >= point1) & (positions < point2)
+    return np.where(inside, point1 + point2 - 1 - positions, positions)
+
+def batch_inversion(genes, rows, rng=None):
+    """
+    Inversion of the given rows of a (size, length) gene array, done with one gather for all rows.
+    """
+    length = genes.shape[1]
+    if length < 4 or len(rows) == 0:
+        return  # Too short to pick two distinct inner points
+    genes[rows] = np.take_along_axis(genes[rows], inversion_indices(len(rows), length, rng), axis=1)
+
+def packed_batch_inversion(words, rows, length, rng=None):
+    """
+    Inversion of the given rows of bit-packed genomes. Reversing an arbitrary bit range does not map
+    onto word operations, so only the selected rows are unpacked, inverted and packed back.
+    """
+    if length < 4 or len(rows) == 0:
+        return
+    genes = unpack_genes(words[rows], length)
+    words[rows] = pack_genes(np.take_along_axis(genes, inversion_indices(len(rows), length, rng), axis=1))
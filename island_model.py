@@ -0,0 +1,138 @@
+import copy
+import traceback
+import multiprocessing as mp
+from genetic_algorithm import GeneticAlgorithm
+from random_streams import seed_sequence
+from logger import log, shutdown_logging
+
+# Parametry wspólne dla wszystkich wysp: definicja problemu i liczba epok (wyspy migrują w tych samych epokach)
+SHARED_PARAMETERS = ['fitness_function', 'lower_bound', 'upper_bound', 'precision', 'num_variables',
+                     'maximization', 'epochs_num']
+
+class IslandModel:
+    """
+    Island-model genetic algorithm.
+
+    Runs one GeneticAlgorithm per island in a separate process. Every
+    `migration_interval` epochs each island sends copies of its best
+    `migration_size` individuals to the next island on a ring, where they
+    replace the worst individuals. Islands may use different operators through
+    `island_overrides`, a list of dicts applied on top of the shared config
+    (problem definition parameters and epochs_num, listed in SHARED_PARAMETERS,
+    must stay the same on every island).
+
+    As with any multiprocessing code, run() must be called from under
+    `if __name__ == "__main__":` on platforms that spawn processes.
+
+    Each island evolves with its own random stream spawned from config.seed,
+    so a seeded island run is reproducible (up to the timing of migrations).
+    """
+
+    def __init__(self, config, num_islands=4, migration_interval=10, migration_size=2, island_overrides=None):
+        self.config = config
+        self.island_overrides = island_overrides or [{} for _ in range(num_islands)]
+        self.num_islands = len(self.island_overrides)
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.optimum = float('inf') if not config.maximization else float('-inf')
+        self.optimum_variables = None
+        # Wiersze w formacie GeneticAlgorithm.progress_data, połączone ze wszystkich wysp dla każdej epoki
+        self.progress_data = []
+        # Wiersze poszczególnych wysp: [island, epoch, population_size, current_best_fitness, ...]
+        self.island_progress_data = []
+
+    def island_config(self, island):
+        """Build the configuration of a single island."""
+        shared = [key for key in self.island_overrides[island] if key in SHARED_PARAMETERS]
+        if shared:
+            raise ValueError(f"Island {island} cannot override shared parameters: {', '.join(shared)}")
+        island_config = copy.deepcopy(self.config)
+        island_config.update_from_dict(self.island_overrides[island])
+        return island_config
+
+    def run(self):
+        """Run all islands in parallel and return the merged progress data."""
+        self.progress_data = []
+        self.island_progress_data = []
+        context = mp.get_context()
+        inboxes = [context.Queue() for _ in range(self.num_islands)]
+        results = context.Queue()
+        seeds = seed_sequence(self.config.seed).spawn(self.num_islands)
+        processes = [
+            context.Process(
+                target=_run_island,
+                args=(island, self.island_config(island), inboxes[island], inboxes[(island + 1) % self.num_islands],
+                      results, self.migration_interval, self.migration_size, seeds[island])
+            ) for island in range(self.num_islands)
+        ]
+        for process in processes:
+            process.start()
+
+        pending_epochs = {}
+        finished = 0
+        try:
+            while finished < self.num_islands:
+                message = results.get()
+                if message[0] == 'epoch':
+                    _, island, row = message
+                    self.island_progress_data.append([island, *row])
+                    rows = pending_epochs.setdefault(row[0], [])
+                    rows.append(row)
+                    if len(rows) == self.num_islands:
+                        self.progress_data.append(self.merge_epoch(pending_epochs.pop(row[0])))
+                elif message[0] == 'done':
+                    _, island, optimum, optimum_variables = message
+                    if self.is_better(optimum, self.optimum):
+                        self.optimum = optimum
+                        self.optimum_variables = optimum_variables
+                    finished += 1
+                elif message[0] == 'error':
+                    raise RuntimeError(f"Island {message[1]} failed:\n{message[2]}")
+        finally:
+            for process in processes:
+                if finished < self.num_islands:
+                    process.terminate()
+                process.join()
+
+        log("Found optimum on %d islands: [%s, %s]", self.num_islands, self.optimum, self.optimum_variables)
+        return self.progress_data
+
+    def is_better(self, fitness, reference):
+        return fitness > reference if self.config.maximization else fitness < reference
+
+    def merge_epoch(self, rows):
+        """
+        Merge one epoch's rows from all islands into a single progress_data row:
+        [epoch, total_population, current_best_fitness, x1..xn, best_fitness_all_time, best_x1..best_xn]
+        """
+        num_variables = self.config.num_variables
+        best_index = 3 + num_variables
+        pick = max if self.config.maximization else min
+        current = pick(rows, key=lambda row: row[2])
+        best = pick(rows, key=lambda row: row[best_index])
+        total_population = sum(row[1] for row in rows)
+        return [rows[0][0], total_population, *current[2:best_index], *best[best_index:]]
+
+def _run_island(island, config, inbox, outbox, results, migration_interval, migration_size, seed):
+    """Process entry point evolving one island and exchanging migrants with its ring neighbours."""
+    ga = None
+    try:
+        # Każda wyspa ma własny, niezależny strumień losowy (potomek SeedSequence całego modelu)
+        ga = GeneticAlgorithm(config, seed=seed)
+        for epoch in range(config.epochs_num):
+            ga.iteration(epoch)
+            results.put(('epoch', island, ga.last_epoch_data))
+            if (epoch + 1) % migration_interval == 0 and epoch + 1 < config.epochs_num:
+                # Ocena potomstwa przed migracją - flagi dirty sprawiają, że kolejna epoka jej nie powtórzy
+                ga.evaluate_fitness()
+                outbox.put(ga.population.emigrants(migration_size, config.maximization))
+                genes, fitness = inbox.get()
+                ga.population.immigrate(genes, fitness, config.maximization)
+        results.put(('done', island, ga.optimum, ga.optimum_variables))
+    except Exception:
+        results.put(('error', island, traceback.format_exc()))
+    finally:
+        if ga is not None:
+            ga.close()
+        # Proces wyspy kończy się bez atexit - zapisujemy zakolejkowane wpisy logu
+        shutdown_logging()
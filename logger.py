@@ -1,48 +1,50 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAME = "GenAlgLogger"
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored timestamp"""
-    
+
     # ANSI color codes
     GREEN = '\033[92m'
     BLUE = '\033[94m'
     RESET = '\033[0m'
-    
-    def format(self, record):
-        # Store the original format
-        orig_fmt = self._style._fmt
-        
-        # Apply colors to the datetime portion
-        self._style._fmt = f"{self.BLUE}%(asctime)s{self.RESET} - %(message)s"
-        
-        # Call the original formatter's format method
-        result = logging.Formatter.format(self, record)
-        
-        # Restore the original format
-        self._style._fmt = orig_fmt
-        
-        return result
+
+    def __init__(self, fmt="%(asctime)s - %(message)s", datefmt=None):
+        # The colored format is built once instead of being swapped in for every record
+        super().__init__(fmt.replace("%(asctime)s", f"{self.BLUE}%(asctime)s{self.RESET}"), datefmt)
+
+# Default verbosity, changed with set_log_level()
+logging.getLogger(LOGGER_NAME).setLevel(logging.INFO)
 
 # Module-level logger instance - initialized on first use
 _logger = None
+# Background thread writing queued records to the console and file handlers
+_listener = None
+# Process that owns the listener (a forked child has to start its own) and the current log file
+_pid = None
+_log_file = None
 
 def _initialize_logger():
     """Initialize the logger if not already done"""
-    global _logger
-    
-    if _logger is not None:
+    global _logger, _listener, _pid, _log_file
+
+    if _logger is not None and _pid == os.getpid():
         return _logger
-        
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)
-    time_stamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    log_file = os.path.join(log_dir, f"run_{time_stamp}.log")
-
-    logger = logging.getLogger("GenAlgLogger")
-    logger.setLevel(logging.INFO)
-    
+
+    if _log_file is None:
+        log_dir = "logs"
+        os.makedirs(log_dir, exist_ok=True)
+        time_stamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        _log_file = os.path.join(log_dir, f"run_{time_stamp}.log")
+
+    logger = logging.getLogger(LOGGER_NAME)
+
     # Clear any existing handlers
     if logger.handlers:
         logger.handlers.clear()
@@ -62,18 +64,54 @@ def _initialize_logger():
     # Console handler with colored output
     ch = logging.StreamHandler()
     ch.setFormatter(console_formatter)
-    logger.addHandler(ch)
 
     # File handler (no colors in file)
-    fh = logging.FileHandler(log_file)
+    fh = logging.FileHandler(_log_file)
     fh.setFormatter(file_formatter)
-    logger.addHandler(fh)
-    
+
+    # The calling thread only enqueues records; console and file I/O happen on the listener thread
+    records = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(records))
+    _listener = QueueListener(records, ch, fh)
+    _listener.start()
+    atexit.register(_listener.stop)
+
     _logger = logger
+    _pid = os.getpid()
     return logger
 
+def set_log_level(level):
+    """
+    Set the verbosity of the log; accepts a level name ('DEBUG', 'INFO', 'WARNING', ...) or number.
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    logging.getLogger(LOGGER_NAME).setLevel(level)
+
+def is_enabled(level=logging.INFO):
+    """
+    Whether messages of the given level are written (lets callers skip building them).
+    """
+    return logging.getLogger(LOGGER_NAME).isEnabledFor(level)
+
 # Expose logging methods directly
-def log(msg, *args, **kwargs):
-    if _logger is None:
+def log(msg, *args, level=logging.INFO, **kwargs):
+    # Formatting with %-style args is deferred and skipped when the level is disabled
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.isEnabledFor(level):
+        return
+    if _logger is None or _pid != os.getpid():
         _initialize_logger()
-    return _logger.info(msg, *args, **kwargs)
+    return _logger.log(level, msg, *args, **kwargs)
+
+def shutdown_logging():
+    """
+    Write all queued records and stop the listener thread (e.g. before a worker process exits);
+    the next log() call starts logging again.
+    """
+    global _logger, _listener
+    if _listener is not None and _pid == os.getpid():
+        _listener.stop()
+        atexit.unregister(_listener.stop)
+    _listener = None
+    _logger = None
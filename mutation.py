@@ -1,27 +1,82 @@
 import numpy as np
+from random_streams import ensure_rng
+from bitpacking import bit_mask, num_words
 
-def single_point_mutation(chromosome):
+def single_point_mutation(chromosome, rng=None):
     """
     Mutates a single random point in the chromosome.
     """
-    mutation_point = np.random.randint(len(chromosome.genes))
-    chromosome.genes[mutation_point] = not chromosome.genes[mutation_point]
+    _mutate_chromosome('single_point', chromosome, rng)
 
-def two_point_mutation(chromosome):
+def two_point_mutation(chromosome, rng=None):
     """
     Mutates two random points in the chromosome.
     """
-    points = np.random.choice(range(len(chromosome.genes)), 2, replace=False)
-    for point in points:
-        chromosome.genes[point] = not chromosome.genes[point]
+    _mutate_chromosome('two_point', chromosome, rng)
 
-def boundary_mutation(chromosome):
+def boundary_mutation(chromosome, rng=None):
     """
     Mutates the first or the last gene of the chromosome.
     """
-    if np.random.rand() > 0.5:
-        # Mutate the first gene
-        chromosome.genes[0] = not chromosome.genes[0]
-    else:
-        # Mutate the last gene
-        chromosome.genes[-1] = not chromosome.genes[-1]
\ No newline at end of file
+    _mutate_chromosome('boundary', chromosome, rng)
+
+def _mutate_chromosome(method, chromosome, rng=None):
+    # Pojedynczy chromosom jako jednoelementowa partia dla masek mutacji (zmiana w miejscu)
+    chromosome.genes ^= mutation_masks(method, 1, len(chromosome.genes), rng)[0]
+
+
+# Mutacja wsadowa: maski odwracanych bitów losowane są naraz dla wszystkich mutowanych osobników
+# i nakładane przez XOR (na genomach bool lub spakowanych słowach uint64).
+
+def mutation_points(method, count, length, rng=None):
+    """
+    Positions of the genes flipped by a point mutation method, for `count` individuals at once.
+    Returns an array of shape (count, points_per_individual).
+    """
+    rng = ensure_rng(rng)
+    if method == 'single_point':
+        return rng.integers(0, length, (count, 1))
+    elif method == 'two_point':
+        first = rng.integers(0, length, count)
+        second = rng.integers(0, length - 1, count)
+        second += second >= first
+        return np.stack((first, second), axis=1)
+    elif method == 'boundary':
+        return np.where(rng.random((count, 1)) > 0.5, 0, length - 1)
+    raise ValueError(f"Unknown mutation method: {method}")
+
+def mutation_masks(method, count, length, rng=None):
+    """
+    Boolean flip masks of shape (count, length) for a point mutation method.
+    """
+    masks = np.zeros((count, length), dtype=np.bool_)
+    np.put_along_axis(masks, mutation_points(method, count, length, rng), True, axis=1)
+    return masks
+
+def packed_mutation_masks(method, count, length, rng=None):
+    """
+    Flip masks for bit-packed genomes, shape (count, num_words).
+    """
+    points = mutation_points(method, count, length, rng)
+    return np.bitwise_or.reduce(bit_mask(points, num_words(length)), axis=1)
+
+def bit_flip_positions(count, length, probability, rng=None):
+    """
+    Bits flipped by bit-flip mutation, each of the count x length bits independently with the given
+    probability. Returns (individuals, bits) index arrays of the flipped bits, each bit at most once.
+    """
+    rng = ensure_rng(rng)
+    total = count * length
+    if probability <= 0 or total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # Odstępy między kolejnymi odwróconymi bitami (w spłaszczonej populacji) mają rozkład geometryczny,
+    # więc losujemy tylko tyle liczb, ile jest mutacji, zamiast macierzy count x length
+    expected = total * min(probability, 1.0)
+    gaps = [rng.geometric(min(probability, 1.0), int(expected + 5 * np.sqrt(expected) + 10))]
+    position = gaps[0].sum()
+    while position < total:
+        gaps.append(rng.geometric(min(probability, 1.0), int(5 * np.sqrt(expected) + 10)))
+        position += gaps[-1].sum()
+    flat = np.cumsum(np.concatenate(gaps)) - 1
+    flat = flat[flat < total]
+    return flat // length, flat % length
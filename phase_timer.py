@@ -0,0 +1,73 @@
+import time
+
+NS_PER_SECOND = 1e9
+
+class PhaseTimer:
+    """
+    Wall-clock time of the algorithm phases (evaluate, report, selection, ...), measured with
+    perf_counter_ns. Keeps the cumulative time and call count of every phase and the time
+    spent in each phase during the current epoch.
+    """
+
+    def __init__(self):
+        self.total_ns = {}
+        self.calls = {}
+        self.epoch_ns = {}
+        self.epochs = 0
+
+    def start_epoch(self):
+        # Czasy bieżącej epoki zerowane, sumy narastające zostają
+        self.epochs += 1
+        self.epoch_ns = dict.fromkeys(self.epoch_ns, 0)
+
+    def measure(self, phase, function, *args):
+        """
+        Call function(*args), add its duration to the given phase and return its result.
+        """
+        start = time.perf_counter_ns()
+        result = function(*args)
+        elapsed = time.perf_counter_ns() - start
+        self.total_ns[phase] = self.total_ns.get(phase, 0) + elapsed
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.epoch_ns[phase] = self.epoch_ns.get(phase, 0) + elapsed
+        return result
+
+    def total_time(self):
+        """Total measured time of all phases in seconds."""
+        return sum(self.total_ns.values()) / NS_PER_SECOND
+
+    def summary(self, evaluations=None):
+        """
+        Timing data as a dict (times in seconds):
+        {'epochs', 'total_time', 'evaluations', 'evaluations_per_second',
+         'phases': {phase: {'time', 'calls', 'mean_time', 'last_epoch_time', 'share'}}}
+        """
+        total_time = self.total_time()
+        phases = {
+            phase: {
+                'time': total_ns / NS_PER_SECOND,
+                'calls': self.calls[phase],
+                'mean_time': total_ns / self.calls[phase] / NS_PER_SECOND,
+                'last_epoch_time': self.epoch_ns.get(phase, 0) / NS_PER_SECOND,
+                'share': total_ns / NS_PER_SECOND / total_time if total_time > 0 else 0.0,
+            } for phase, total_ns in self.total_ns.items()
+        }
+        return {
+            'epochs': self.epochs,
+            'total_time': total_time,
+            'evaluations': evaluations,
+            'evaluations_per_second': evaluations / total_time if evaluations is not None and total_time > 0 else None,
+            'phases': phases,
+        }
+
+def format_timing_summary(summary):
+    """
+    Human-readable table of a PhaseTimer.summary() dict, e.g. for the log.
+    """
+    lines = [f"Phase timing over {summary['epochs']} epochs: {summary['total_time']:.3f} s"]
+    if summary['evaluations_per_second'] is not None:
+        lines[0] += f", {summary['evaluations']} evaluations ({summary['evaluations_per_second']:.0f} evaluations/s)"
+    for phase, data in summary['phases'].items():
+        lines.append(f"\t{phase:<10}\t{data['time']:.3f} s\t{data['share']:6.1%}\t{data['calls']} calls\t"
+                     f"{data['mean_time'] * 1000:.3f} ms/call")
+    return "\n".join(lines)
@@ -1,17 +1,19 @@
+import numpy as np
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 class PlotWidget(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_fps=10):
         super(PlotWidget, self).__init__(parent)
         self.layout = QVBoxLayout(self)
-        
+
         # Create the figure and canvas for plotting
         self.figure = Figure(figsize=(5, 4), dpi=100, facecolor='#1e2433')
         self.canvas = FigureCanvas(self.figure)
         self.layout.addWidget(self.canvas)
-        
+
         # Initialize the plot
         self.axes = self.figure.add_subplot(111)
         self.axes.set_title('Fitness Evolution', color='#e0e7ff')
@@ -21,57 +23,100 @@ class PlotWidget(QWidget):
         self.axes.set_facecolor('#263041')
         self.axes.tick_params(colors='#e0e7ff')
         self.axes.spines['bottom'].set_color('#3d5a80')
-        self.axes.spines['top'].set_color('#3d5a80') 
+        self.axes.spines['top'].set_color('#3d5a80')
         self.axes.spines['right'].set_color('#3d5a80')
         self.axes.spines['left'].set_color('#3d5a80')
 
-        # Variables to store previous plot data
-        self.current_fitness_line = None
-        self.best_fitness_line = None
-    
-    def update_plot(self, results):
+        # Persistent lines - new points are appended instead of replotting everything
+        self.current_fitness_line, = self.axes.plot([], [], '#56cfe1', linewidth=2, marker='o',
+                                                     markersize=4, label='Current Best Fitness')
+        self.best_fitness_line, = self.axes.plot([], [], '#ff66b3', linewidth=2, marker='s',
+                                                  markersize=4, label='All-time Best Fitness')
+        self.axes.legend(loc='best', facecolor='#263041', edgecolor='#3d5a80', labelcolor='#e0e7ff')
+
+        # Plotted data (columns: epoch, current best fitness, all-time best fitness) in a buffer
+        # that grows by doubling, so appending epochs does not copy the whole history every time
+        self.data = np.empty((1024, 3))
+        self.count = 0
+        self.x_limit = None
+        self.y_limits = None
+
+        # Redraws are coalesced and limited to max_fps frames per second
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(int(1000 / max_fps))
+        self.redraw_timer.timeout.connect(self.canvas.draw_idle)
+
+    def reset_plot(self):
+        """
+        Remove all plotted data before a new run.
         """
-        Update the plot with new results data from the genetic algorithm.
-        
+        self.count = 0
+        self.x_limit = None
+        self.y_limits = None
+        self.current_fitness_line.set_data([], [])
+        self.best_fitness_line.set_data([], [])
+        self.canvas.draw_idle()
+
+    def append_results(self, results):
+        """
+        Append new epochs to the plot. Axis limits change only when the new points fall outside them,
+        and the canvas is redrawn at most max_fps times per second regardless of how many epochs arrive.
+
         Args:
-            results: List of results from each epoch [epoch, pop_size, current_fitness, x1, x2, ..., best_fitness]
+            results: List of new results [epoch, pop_size, current_fitness, x1, ..., xn, best_fitness, best_x1, ..., best_xn]
         """
         if not results:
             return
-            
-        # Clear previous plot
-        self.axes.clear()
-        
-        # Extract data from results
-        epochs = [result[0] for result in results]
-        current_fitness = [result[2] for result in results]  # Current best fitness is at index 2
-        
-        # The best fitness all-time is the last element in each result
-        best_fitness = [result[-1] for result in results]
-        
-        # Plot the data
-        self.axes.plot(epochs, current_fitness, '#56cfe1', linewidth=2, marker='o', 
-                      markersize=4, label='Current Best Fitness')
-        self.axes.plot(epochs, best_fitness, '#ff66b3', linewidth=2, marker='s', 
-                      markersize=4, label='All-time Best Fitness')
-
-        # Add labels and legend
-        self.axes.set_title('Fitness Evolution', color='#e0e7ff')
-        self.axes.set_xlabel('Generation', color='#e0e7ff')
-        self.axes.set_ylabel('Fitness', color='#e0e7ff')
-        self.axes.legend(loc='best', facecolor='#263041', edgecolor='#3d5a80', labelcolor='#e0e7ff')
-        self.axes.grid(True, color='#3d5a80', linestyle='-', alpha=0.3)
-        self.axes.tick_params(colors='#e0e7ff')
-        
-        # Refresh the canvas
-        self.canvas.draw()
-        
+
+        # Current best fitness is at index 2, the all-time best fitness follows the n current variables
+        best_index = len(results[0]) // 2 + 1
+        rows = np.asarray(results, dtype=np.float64)[:, [0, 2, best_index]]
+        if self.count + len(rows) > len(self.data):
+            data = np.empty((max(2 * len(self.data), self.count + len(rows)), 3))
+            data[:self.count] = self.data[:self.count]
+            self.data = data
+        self.data[self.count:self.count + len(rows)] = rows
+        self.count += len(rows)
+
+        self.current_fitness_line.set_data(self.data[:self.count, 0], self.data[:self.count, 1])
+        self.best_fitness_line.set_data(self.data[:self.count, 0], self.data[:self.count, 2])
+        self._update_limits(rows)
+
+        if not self.redraw_timer.isActive():
+            self.redraw_timer.start()
+
+    def _update_limits(self, rows):
+        # Oś X rośnie skokowo (x1.5), więc przeskalowanie nie następuje w każdej epoce
+        last_epoch = rows[-1, 0]
+        if self.x_limit is None or last_epoch > self.x_limit:
+            self.x_limit = max(10, int(last_epoch * 1.5))
+            self.axes.set_xlim(0, self.x_limit)
+
+        low, high = float(rows[:, 1:].min()), float(rows[:, 1:].max())
+        if self.y_limits is None or low < self.y_limits[0] or high > self.y_limits[1]:
+            low = low if self.y_limits is None else min(low, self.y_limits[0])
+            high = high if self.y_limits is None else max(high, self.y_limits[1])
+            self.y_limits = (low, high)
+            margin = (high - low) * 0.05 or abs(high) * 0.05 or 1.0
+            self.axes.set_ylim(low - margin, high + margin)
+
+    def update_plot(self, results):
+        """
+        Replace the plotted data with the full results data from the genetic algorithm.
+
+        Args:
+            results: List of results from each epoch [epoch, pop_size, current_fitness, x1, ..., xn, best_fitness, best_x1, ..., best_xn]
+        """
+        self.reset_plot()
+        self.append_results(results)
+
     def save_plot(self, filepath):
         """
         Save the current plot to an image file.
-        
+
         Args:
             filepath: Path where to save the image
         """
         self.figure.savefig(filepath, dpi=300, bbox_inches='tight', facecolor=self.figure.get_facecolor())
-        return True
\ No newline at end of file
+        return True
@@ -2,85 +2,322 @@ import numpy as np
 from individual import Individual
 from chromosome import Chromosome
 from selection_methods import select_best, roulette_wheel_selection, tournament_selection
-from cross_methods import single_point_crossover, two_point_crossover, uniform_crossover, granular_crossover
-from mutation import single_point_mutation, two_point_mutation, boundary_mutation
-from inversion import inversion
+from cross_methods import crossover_masks, packed_crossover_masks
+from mutation import mutation_masks, packed_mutation_masks, bit_flip_positions
+from inversion import batch_inversion, packed_batch_inversion
+from bitpacking import pack_genes, unpack_genes, masked_crossover, flip_bits
+from fitness_cache import FitnessCache
+from evaluators import SerialEvaluator
+from decoder import ChromosomeDecoder
+from fitness_functions import as_batch_fitness_function
+from random_streams import ensure_rng
 
 class Population:
-    def __init__(self, size, chromosome_length, fitness_function, num_variables, begin_range, end_range):
-        self.individuals = [
-            Individual(
-                chromosome=Chromosome(chromosome_length)
-            ) for _ in range(size)
-        ]
-        self.fitness_function = fitness_function
+    def __init__(self, size, chromosome_length, fitness_function, num_variables, begin_range, end_range, packed=False,
+                 fitness_cache_size=0, evaluator=None, maximization=False, rng=None):
+        # Generator liczb losowych przekazywany do wszystkich operatorów
+        self.rng = ensure_rng(rng)
+        # Genomy całej populacji przechowywane w jednej ciągłej tablicy (size, chromosome_length)
+        self.genes = self.rng.integers(0, 2, (size, chromosome_length), dtype=np.uint8).astype(np.bool_)
+        # Opcjonalnie genomy spakowane do słów uint64 (size, ceil(chromosome_length / 64)) - 8x mniej pamięci
+        self.packed = packed
+        if packed:
+            self.genes = pack_genes(self.genes)
+        # Wektor wartości fitness równoległy do wierszy tablicy genów
+        self.fitness = np.full(size, np.nan)
+        # Flagi wierszy nowych lub zmodyfikowanych od ostatniej oceny - tylko one są oceniane ponownie
+        self.dirty = np.ones(size, dtype=np.bool_)
+        # Łączna liczba ocen funkcji fitness (bez trafień w cache i osobników niezmienionych)
+        self.evaluations = 0
+        self.chromosome_length = chromosome_length
+        # Funkcja fitness w wersji wsadowej: macierz (N, D) -> wektor N wartości
+        self.fitness_function = as_batch_fitness_function(fitness_function)
+        # Backend oceny (szeregowy lub pula procesów) wywoływany z macierzą zdekodowanych zmiennych
+        self.evaluator = evaluator or SerialEvaluator(self.fitness_function)
         self.num_variables = num_variables
         self.begin_range = begin_range
         self.end_range = end_range
-        self.elite_individuals = []
-        
+        # Dekoder z wagami potęg dwójki wyliczonymi raz dla danej konfiguracji
+        self.decoder = ChromosomeDecoder(chromosome_length, num_variables, begin_range, end_range)
+        # Cache wartości fitness kluczowany zawartością genomu (0 wyłącza cache)
+        self.fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size > 0 else None
+        # Najlepszy osobnik pokolenia i najlepszy dotychczas, wyznaczane raz podczas oceny
+        self.maximization = maximization
+        self.best_genes = None
+        self.best_fitness = None
+        self.best_variables = None
+        self.best_ever_fitness = None
+        self.best_ever_variables = None
+        self.best_ever_genes = None
+        self.elite_genes = self.genes[:0].copy()
+        self.elite_fitness = self.fitness[:0].copy()
+        # Drugi zestaw buforów dla stałego rozmiaru populacji (zamieniane co pokolenie) i bufor potomstwa steady-state
+        self._next_genes = None
+        self._next_fitness = None
+        self._next_dirty = None
+        self._offspring = None
+
+    @property
+    def size(self):
+        # Aktualna liczba osobników w populacji
+        return len(self.genes)
+
+    @property
+    def individuals(self):
+        # Lekkie widoki Individual/Chromosome na wiersze tablicy genów (dla GUI i raportów)
+        return [self.individual(index) for index in range(self.size)]
+
+    def individual(self, index):
+        # Widok pojedynczego osobnika - chromosom współdzieli pamięć z wierszem tablicy genów
+        # (dla genomów spakowanych jest to rozpakowana kopia wiersza)
+        return self._make_individual(self.genes[index], self.fitness[index])
+
+    def best_individual(self):
+        # Najlepszy osobnik z ostatniej oceny - z kopii wiersza, bo selekcja i krzyżowanie zmieniają kolejność wierszy
+        if self.best_genes is None:
+            return None
+        return self._make_individual(self.best_genes, self.best_fitness)
+
+    def _make_individual(self, row, fitness):
+        genes = unpack_genes(row, self.chromosome_length) if self.packed else row
+        individual = Individual(Chromosome(self.chromosome_length, genes=genes))
+        if not np.isnan(fitness):
+            individual.fitness = float(fitness)
+        return individual
+
+    def _take(self, indices):
+        # Zastąpienie populacji wierszami o podanych indeksach
+        self.genes = self.genes[indices]
+        self.fitness = self.fitness[indices]
+        self.dirty = self.dirty[indices]
+
+    def decode(self, genes=None):
+        # Wsadowe dekodowanie genomów (domyślnie całej populacji) do macierzy (N, num_variables)
+        return self.decoder.decode(self.genes if genes is None else genes)
+
     def evaluate_fitness(self):
-        # Obliczenie fitnes dla każdego osobnika w populacji
-        for individual in self.individuals:
-            individual.calculate_fitness(
-                lambda: self.fitness_function(
-                    individual.decode_chromosome(self.num_variables, self.begin_range, self.end_range)
-                )
-            )
-
-    def selection(self, method='tournament', num_to_select=None, tournament_size=3, maximization=False):
+        # Obliczenie fitnes tylko dla osobników nowych lub zmodyfikowanych (flaga dirty),
+        # pozostałe zachowują wartość z poprzedniej oceny
+        dirty = np.flatnonzero(self.dirty)
+        if len(dirty) > 0:
+            if self.fitness_cache is None:
+                self.fitness[dirty] = self.evaluator(self.decode(self.genes[dirty]))
+                self.evaluations += len(dirty)
+            else:
+                self._evaluate_cached(dirty)
+            self.dirty[dirty] = False
+        self._track_best()
+
+    def _track_best(self):
+        # Jedno przejście po wektorze fitness i dekodowanie tylko najlepszego osobnika
+        best_index = int(self.fitness.argmax() if self.maximization else self.fitness.argmin())
+        self.best_genes = self.genes[best_index].copy()
+        self.best_fitness = float(self.fitness[best_index])
+        self.best_variables = self.decode(self.best_genes).tolist()
+        if self.best_ever_fitness is None or self.is_better(self.best_fitness, self.best_ever_fitness):
+            self.best_ever_fitness = self.best_fitness
+            self.best_ever_variables = self.best_variables
+            self.best_ever_genes = self.best_genes
+
+    def is_better(self, fitness, reference):
+        return fitness > reference if self.maximization else fitness < reference
+
+    def _evaluate_cached(self, indices):
+        # Z cache korzystamy po kluczu z bajtów genomu, liczymy tylko brakujące (unikalne) genomy
+        pending = {}
+        for index in indices:
+            key = self.genes[index].tobytes()
+            value = self.fitness_cache.lookup(key)
+            if value is not None:
+                self.fitness[index] = value
+            else:
+                pending.setdefault(key, []).append(index)
+        if not pending:
+            return
+
+        first_indices = [rows[0] for rows in pending.values()]
+        values = self.evaluator(self.decode(self.genes[first_indices]))
+        self.evaluations += len(first_indices)
+        for (key, rows), value in zip(pending.items(), values):
+            self.fitness[rows] = value
+            self.fitness_cache.store(key, float(value))
+
+    def selection(self, method='tournament', num_to_select=None, tournament_size=3, maximization=False,
+                  roulette_sampler='sus', roulette_scaling='linear'):
+        # Zmienny rozmiar populacji: po selekcji zostają tylko wybrani osobnicy
+        self._take(self.selection_indices(method, num_to_select, tournament_size, maximization,
+                                          roulette_sampler, roulette_scaling))
+
+    def selection_indices(self, method='tournament', num_to_select=None, tournament_size=3, maximization=False,
+                          roulette_sampler='sus', roulette_scaling='linear'):
+        """
+        Returns the indices of the individuals chosen by the selection method, without changing the population.
+        """
+        num_to_select = num_to_select or self.size // 2
         if method == 'best':
-            self.individuals = select_best(self.individuals, num_to_select or len(self.individuals) // 2, maximization)
+            return select_best(self.fitness, num_to_select, maximization)
         elif method == 'roulette':
-            self.individuals = roulette_wheel_selection(self.individuals, num_to_select or len(self.individuals) // 2)
+            return roulette_wheel_selection(self.fitness, num_to_select, maximization, roulette_sampler, roulette_scaling, self.rng)
         elif method == 'tournament':
-            self.individuals = tournament_selection(self.individuals, num_to_select or len(self.individuals) // 2, tournament_size)
+            return tournament_selection(self.fitness, num_to_select, tournament_size, maximization, self.rng)
         elif method == 'elite':
-            self.individuals = np.random.choice(self.individuals, num_to_select or len(self.individuals) // 2, replace=False).tolist()
+            return self.rng.choice(self.size, num_to_select, replace=False)
+        raise ValueError(f"Unknown selection method: {method}")
 
     def crossover(self, method, cross_probability):
-        new_population = []
-        for _ in range(len(self.individuals) // 2):
-            if np.random.rand() < cross_probability:
-                parent1, parent2 = np.random.choice(self.individuals, 2, replace=False)
-                if method == 'single_point':
-                    child1, child2 = single_point_crossover(parent1.chromosome, parent2.chromosome)
-                elif method == 'two_points':
-                    child1, child2 = two_point_crossover(parent1.chromosome, parent2.chromosome)
-                elif method == 'uniform':
-                    child1, child2 = uniform_crossover(parent1.chromosome, parent2.chromosome)
-                elif method == 'granular':
-                    child1, child2 = granular_crossover(parent1.chromosome, parent2.chromosome)
-                new_population.extend([Individual(child1), Individual(child2)])
-        self.individuals.extend(new_population)
-        
-    def mutate(self, method, mutation_probability):
-        for individual in self.individuals:
-            if np.random.rand() < mutation_probability:
-                if method == 'single_point':
-                    single_point_mutation(individual.chromosome)
-                elif method == 'two_points':
-                    two_point_mutation(individual.chromosome)
-                elif method == 'boundary':
-                    boundary_mutation(individual.chromosome)
-    
-    def apply_inversion(self, inversion_probability):
-        for individual in self.individuals:
-            if np.random.rand() < inversion_probability:
-                inversion(individual.chromosome)
-                
+        # Wszystkie pary rodziców i maski krzyżowania losowane są naraz, potomstwo trafia do prealokowanej tablicy
+        num_pairs = self.size // 2
+        count = int(np.count_nonzero(self.rng.random(num_pairs) < cross_probability))
+        if count == 0:
+            return
+        # Drugi rodzic przesunięty o 1..size-1 pozycji, więc zawsze różni się od pierwszego
+        parents1 = self.rng.integers(0, self.size, count)
+        parents2 = (parents1 + self.rng.integers(1, self.size, count)) % self.size
+        if self.packed:
+            masks = packed_crossover_masks(method, count, self.chromosome_length, rng=self.rng)
+        else:
+            masks = crossover_masks(method, count, self.chromosome_length, rng=self.rng)
+        offspring = np.empty((2 * count, self.genes.shape[1]), dtype=self.genes.dtype)
+        masked_crossover(self.genes[parents1], self.genes[parents2], masks, offspring[:count], offspring[count:])
+        self.genes = np.concatenate((self.genes, offspring))
+        self.fitness = np.concatenate((self.fitness, np.full(2 * count, np.nan)))
+        self.dirty = np.concatenate((self.dirty, np.ones(2 * count, dtype=np.bool_)))
+
+    def next_generation(self, parents, method, cross_probability, elite_count=0, maximization=False):
+        """
+        Generational replacement with a fixed population size. The next generation (elites followed by
+        offspring of the selected parents) is written into a second preallocated buffer, which is then
+        swapped with the current one. Returns the indices of the offspring rows.
+        """
+        if self._next_genes is None or self._next_genes.shape != self.genes.shape:
+            self._next_genes = np.empty_like(self.genes)
+            self._next_fitness = np.empty_like(self.fitness)
+            self._next_dirty = np.empty_like(self.dirty)
+        genes, fitness, dirty = self._next_genes, self._next_fitness, self._next_dirty
+
+        # Elita przechodzi bez zmian (z zachowaną wartością fitness), resztę bufora wypełnia potomstwo
+        elites = select_best(self.fitness, elite_count, maximization) if elite_count > 0 else np.empty(0, dtype=np.intp)
+        np.take(self.genes, elites, axis=0, out=genes[:len(elites)])
+        np.take(self.fitness, elites, out=fitness[:len(elites)])
+        np.take(self.dirty, elites, out=dirty[:len(elites)])
+        sources, crossed = self._breed(parents, method, cross_probability, genes[len(elites):])
+        # Kopie rodziców (pary bez krzyżowania) zachowują fitness i flagę dirty rodzica
+        fitness[len(elites):] = np.where(crossed, np.nan, self.fitness[sources])
+        dirty[len(elites):] = crossed | self.dirty[sources]
+
+        self._next_genes, self.genes = self.genes, genes
+        self._next_fitness, self.fitness = self.fitness, fitness
+        self._next_dirty, self.dirty = self.dirty, dirty
+        return np.arange(len(elites), self.size)
+
+    def replace_worst(self, parents, count, method, cross_probability, maximization=False):
+        """
+        Steady-state replacement: `count` offspring of the selected parents overwrite the worst
+        individuals in place. Returns the indices of the replaced rows.
+        """
+        count = min(count, self.size)
+        if self._offspring is None or len(self._offspring) != count:
+            self._offspring = np.empty((count, self.genes.shape[1]), dtype=self.genes.dtype)
+        sources, crossed = self._breed(parents, method, cross_probability, self._offspring)
+        offspring_fitness = np.where(crossed, np.nan, self.fitness[sources])
+        offspring_dirty = crossed | self.dirty[sources]
+        worst = select_best(self.fitness, count, not maximization)
+        self.genes[worst] = self._offspring
+        self.fitness[worst] = offspring_fitness
+        self.dirty[worst] = offspring_dirty
+        return worst
+
+    def _breed(self, parents, method, cross_probability, out):
+        # Potomstwo losowych par rodziców zapisywane do `out`; pary bez krzyżowania dają kopie rodziców.
+        # Zwraca dla każdego dziecka wiersz rodzica, którego jest kopią, i czy powstało z krzyżowania
+        count = len(out)
+        num_pairs = count - count // 2
+        first = self.rng.integers(0, len(parents), num_pairs)
+        if len(parents) > 1:
+            second = (first + self.rng.integers(1, len(parents), num_pairs)) % len(parents)
+        else:
+            # Jeden rodzic tworzy parę sam ze sobą
+            second = first
+        parents1 = self.genes[parents[first]]
+        parents2 = self.genes[parents[second]]
+        crossing = self.rng.random(num_pairs) < cross_probability
+        if self.packed:
+            masks = packed_crossover_masks(method, num_pairs, self.chromosome_length, rng=self.rng)
+        else:
+            masks = crossover_masks(method, num_pairs, self.chromosome_length, rng=self.rng)
+        masks[~crossing] = ~masks.dtype.type(0)
+        inverted = ~masks
+        np.bitwise_and(parents1, masks, out=out[:num_pairs])
+        out[:num_pairs] |= parents2 & inverted
+        rest = count - num_pairs
+        np.bitwise_and(parents2[:rest], masks[:rest], out=out[num_pairs:])
+        out[num_pairs:] |= parents1[:rest] & inverted[:rest]
+        sources = np.concatenate((parents[first], parents[second[:rest]]))
+        crossed = np.concatenate((crossing, crossing[:rest]))
+        return sources, crossed
+
+    def mutate(self, method, mutation_probability, rows=None):
+        # Mutacja całej populacji (lub wskazanych wierszy) jako jeden XOR z maską;
+        # 'bit_flip' odwraca każdy bit z prawdopodobieństwem mutacji
+        candidates = np.arange(self.size) if rows is None else np.asarray(rows)
+        if method == 'bit_flip':
+            # Losowane są tylko pozycje odwracanych bitów - bez gęstej macierzy liczb losowych N x L
+            individuals, bits = bit_flip_positions(len(candidates), self.chromosome_length, mutation_probability, self.rng)
+            rows = candidates[individuals]
+            if self.packed:
+                flip_bits(self.genes, rows, bits)
+            else:
+                self.genes[rows, bits] ^= True
+        else:
+            rows = candidates[self.rng.random(len(candidates)) < mutation_probability]
+            if self.packed:
+                masks = packed_mutation_masks(method, len(rows), self.chromosome_length, self.rng)
+            else:
+                masks = mutation_masks(method, len(rows), self.chromosome_length, self.rng)
+            self.genes[rows] ^= masks
+        self.dirty[rows] = True
+
+    def apply_inversion(self, inversion_probability, rows=None):
+        candidates = np.arange(self.size) if rows is None else np.asarray(rows)
+        rows = candidates[self.rng.random(len(candidates)) < inversion_probability]
+        if self.packed:
+            packed_batch_inversion(self.genes, rows, self.chromosome_length, self.rng)
+        else:
+            batch_inversion(self.genes, rows, self.rng)
+        self.dirty[rows] = True
+
+    def emigrants(self, count, maximization=False):
+        """
+        Returns copies of the best `count` individuals (unpacked genes and fitness) for migration to another island.
+        """
+        indices = select_best(self.fitness, count, maximization)
+        genes = unpack_genes(self.genes[indices], self.chromosome_length) if self.packed else self.genes[indices].copy()
+        return genes, self.fitness[indices].copy()
+
+    def immigrate(self, genes, fitness, maximization=False):
+        """
+        Replaces the worst individuals with immigrants received from another island.
+        """
+        worst = select_best(self.fitness, len(genes), not maximization)
+        self.genes[worst] = pack_genes(genes) if self.packed else genes
+        self.fitness[worst] = fitness
+        self.dirty[worst] = False
+
     def elitism(self, elite_count, maximization=False):
         """
         Stores a specified number of elite individuals from the current population.
         These individuals are passed directly to the next generation without changes.
         """
-        assert elite_count <= len(self.individuals), "Elite count must be less than or equal to the population size"
-        sorted_by_fitness = sorted(self.individuals, key=lambda x: x.fitness, reverse=True) if maximization else sorted(self.individuals, key=lambda x: x.fitness)
-        self.elite_individuals = sorted_by_fitness[:elite_count]
+        assert elite_count <= self.size, "Elite count must be less than or equal to the population size"
+        elite_indices = select_best(self.fitness, elite_count, maximization)
+        self.elite_genes = self.genes[elite_indices].copy()
+        self.elite_fitness = self.fitness[elite_indices].copy()
 
     def integrate_elites(self):
         """
         Integrate elite individuals back into the population after other evolutionary processes.
         This is typically done before the mutation step to ensure that elite individuals are not altered.
         """
-        self.individuals[:len(self.elite_individuals)] = self.elite_individuals
\ No newline at end of file
+        self.genes[:len(self.elite_genes)] = self.elite_genes
+        self.fitness[:len(self.elite_fitness)] = self.elite_fitness
+        self.dirty[:len(self.elite_fitness)] = False
@@ -0,0 +1,38 @@
+"""
+Random number streams.
+
+Every GeneticAlgorithm owns a numpy Generator (PCG64) created from a SeedSequence
+built from config.seed, and passes it to all operators. Independent streams for
+islands and for fitness chunks evaluated in worker processes are spawned from the same SeedSequence, so a seeded
+run is reproducible and parallel streams never overlap.
+"""
+import numpy as np
+
+def seed_sequence(seed=None):
+    """
+    SeedSequence for an int seed, an existing SeedSequence or None (fresh OS entropy).
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+def create_rng(seed=None):
+    """
+    PCG64 Generator for an int seed, a SeedSequence or None (fresh OS entropy).
+    """
+    return np.random.Generator(np.random.PCG64(seed_sequence(seed)))
+
+# Generator używany przez operatory wywołane bez jawnego rng (np. poza GeneticAlgorithm)
+_default_rng = create_rng()
+
+def ensure_rng(rng=None):
+    """
+    Returns the given Generator, or the shared module-level one when rng is None.
+    """
+    return _default_rng if rng is None else rng
+
+def seed_global_random(seed):
+    """
+    Seed the legacy global np.random state (used by stochastic fitness functions) from a SeedSequence.
+    """
+    np.random.seed(seed.generate_state(1)[0])
@@ -0,0 +1,90 @@
+import csv
+import json
+from configuration import GeneticAlgorithmConfig
+
+def results_headers(num_variables):
+    """
+    Column headers matching the rows of GeneticAlgorithm.progress_data.
+    """
+    headers = ["Epoch", "Population Size", "Current Best Fitness"]
+    
+    # Add headers for current epoch's best solution variables
+    for i in range(num_variables):
+        headers.append(f"X{i+1}")
+        
+    headers.append("Best Fitness All Time")
+    
+    # Add headers for best solution variables
+    for i in range(num_variables):
+        headers.append(f"Best X{i+1}")
+    
+    return headers
+
+def write_results_csv(file_path, progress_data, num_variables):
+    """
+    Write progress data rows to a CSV file with headers.
+    """
+    with open(file_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(results_headers(num_variables))
+        
+        # Write the actual data
+        for result in progress_data:
+            writer.writerow(result)
+    
+    return file_path
+
+def write_config_json(file_path, config_params):
+    """
+    Save configuration parameters to a JSON file.
+    """
+    with open(file_path, 'w') as file:
+        # Convert any non-serializable types (like numpy values) to native Python types
+        config_dict = {}
+        for key, value in config_params.items():
+            if isinstance(value, (bool, str, type(None))):
+                config_dict[key] = value
+            elif isinstance(value, int):
+                config_dict[key] = int(value)
+            elif isinstance(value, float):
+                config_dict[key] = float(value)
+            else:
+                config_dict[key] = str(value)
+            
+        json.dump(config_dict, file, indent=4)
+    
+    return file_path
+
+def config_to_dict(config):
+    """
+    Configuration attributes as a JSON-serializable dict (e.g. user fitness functions become text).
+    """
+    return {key: value if isinstance(value, (bool, int, float, str, type(None))) else str(value)
+            for key, value in vars(config).items()}
+
+def load_config_json(file_path):
+    """
+    Load configuration parameters from a JSON file written by write_config_json.
+    Older files saved every number as a float and None as the string "None",
+    so values are converted back to the types of the defaults.
+    """
+    with open(file_path, 'r') as file:
+        config_params = json.load(file)
+    
+    defaults = GeneticAlgorithmConfig()
+    for key, value in config_params.items():
+        if not hasattr(defaults, key):
+            continue
+        default = getattr(defaults, key)
+        if isinstance(default, bool):
+            continue
+        if default is None:
+            # Parametry opcjonalne (seed, kryteria zatrzymania) - "None" to brak wartości
+            if value == "None":
+                config_params[key] = None
+            elif isinstance(value, float) and value.is_integer():
+                config_params[key] = int(value)
+        elif isinstance(default, int) and isinstance(value, float):
+            config_params[key] = int(value)
+    
+    return config_params
@@ -0,0 +1,93 @@
+import csv
+import json
+import numpy as np
+from results_io import results_headers
+
+def metadata_path(file_path):
+    """
+    Path of the JSON file next to a results file holding its metadata (e.g. the stop reason).
+    """
+    return file_path + ".meta.json"
+
+def _write_metadata(file_path, metadata):
+    with open(metadata_path(file_path), 'w') as file:
+        json.dump(metadata, file, indent=4)
+
+class CsvResultsSink:
+    """
+    Streams progress rows to a CSV file as epochs finish.
+    Rows are buffered and written in batches of flush_every rows; metadata such as
+    the stop reason goes to a JSON file next to it (see metadata_path).
+    """
+
+    def __init__(self, file_path, num_variables, flush_every=100):
+        self.file_path = file_path
+        self.flush_every = flush_every
+        self.buffer = []
+        self.metadata = {}
+        self.file = open(file_path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(results_headers(num_variables))
+
+    def write(self, row):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self.writer.writerows(self.buffer)
+        self.buffer.clear()
+        self.file.flush()
+
+    def set_metadata(self, key, value):
+        # Plik wyników nie ma miejsca na metadane - zapisujemy je obok, w pliku JSON
+        self.metadata[key] = value
+        _write_metadata(self.file_path, self.metadata)
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+class BinaryResultsSink:
+    """
+    Streams progress rows to a raw binary file of float64 records (one record per epoch),
+    in the column order of results_headers. Use load_binary_results to read it back;
+    metadata such as the stop reason goes to a JSON file next to it (see metadata_path).
+    """
+
+    def __init__(self, file_path, num_variables, flush_every=100):
+        self.file_path = file_path
+        self.row_length = len(results_headers(num_variables))
+        self.flush_every = flush_every
+        self.buffer = []
+        self.metadata = {}
+        self.file = open(file_path, 'wb')
+
+    def write(self, row):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            np.asarray(self.buffer, dtype=np.float64).tofile(self.file)
+            self.buffer.clear()
+        self.file.flush()
+
+    def set_metadata(self, key, value):
+        # Plik wyników nie ma miejsca na metadane - zapisujemy je obok, w pliku JSON
+        self.metadata[key] = value
+        _write_metadata(self.file_path, self.metadata)
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+def load_binary_results(file_path, num_variables):
+    """
+    Memory-map a file written by BinaryResultsSink as an (epochs, columns) float64 array.
+    """
+    row_length = len(results_headers(num_variables))
+    return np.memmap(file_path, dtype=np.float64, mode='r').reshape(-1, row_length)
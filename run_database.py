@@ -0,0 +1,215 @@
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+import numpy as np
+from results_io import config_to_dict
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS configs (
+    id INTEGER PRIMARY KEY,
+    config_hash TEXT NOT NULL UNIQUE,
+    fitness_function TEXT NOT NULL,
+    num_variables INTEGER NOT NULL,
+    maximization INTEGER NOT NULL,
+    config_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    config_id INTEGER NOT NULL REFERENCES configs(id),
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    epochs INTEGER NOT NULL DEFAULT 0,
+    final_fitness REAL,
+    final_variables BLOB,
+    stop_reason TEXT
+);
+CREATE TABLE IF NOT EXISTS epochs (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    epoch INTEGER NOT NULL,
+    population_size INTEGER NOT NULL,
+    current_best_fitness REAL NOT NULL,
+    current_best_variables BLOB NOT NULL,
+    best_fitness REAL NOT NULL,
+    best_variables BLOB NOT NULL,
+    PRIMARY KEY (run_id, epoch)
+) WITHOUT ROWID;
+-- config_hash is indexed through its UNIQUE constraint
+CREATE INDEX IF NOT EXISTS idx_configs_fitness_function ON configs(fitness_function, num_variables);
+CREATE INDEX IF NOT EXISTS idx_runs_config ON runs(config_id);
+CREATE INDEX IF NOT EXISTS idx_runs_final_fitness ON runs(final_fitness);
+"""
+
+# Parametry problemu i operatorów genetycznych identyfikujące konfigurację; ziarno, liczba epok, kryteria
+# zatrzymania, backend oceny, logowanie i sposób przechowywania genomów nie zmieniają "tej samej konfiguracji"
+CONFIG_HASH_KEYS = [
+    'fitness_function', 'lower_bound', 'upper_bound', 'precision', 'num_variables', 'maximization',
+    'population_size', 'elite_strategy_amount', 'generation_model', 'steady_state_replacement',
+    'crossover_probability', 'mutation_probability', 'inversion_probability',
+    'selection_method', 'select_best_amount', 'select_tournament_size', 'roulette_sampler', 'roulette_scaling',
+    'crossover_method', 'mutation_method',
+]
+
+def config_hash(config_dict):
+    """
+    Stable hash of the problem and operator parameters of a configuration dict (CONFIG_HASH_KEYS),
+    used to group runs of the same configuration.
+    """
+    key_params = {key: config_dict.get(key) for key in CONFIG_HASH_KEYS}
+    return hashlib.sha256(json.dumps(key_params, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _variables_blob(variables):
+    # Zmienne zapisujemy jako surowe bajty float64, aby tabela epok była wąska
+    return np.asarray(variables, dtype=np.float64).tobytes()
+
+def _variables_from_blob(blob):
+    return np.frombuffer(blob, dtype=np.float64).tolist() if blob is not None else None
+
+class RunDatabase:
+    """
+    Embedded SQLite store of runs, their configurations and per-epoch results.
+    """
+
+    def __init__(self, path, check_same_thread=True):
+        # check_same_thread=False pozwala zapisywać z wątku roboczego GUI (połączenie używa jeden wątek naraz)
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def add_config(self, config):
+        """Insert the configuration if it is not stored yet and return its id."""
+        config_dict = config_to_dict(config)
+        digest = config_hash(config_dict)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO configs (config_hash, fitness_function, num_variables, maximization, config_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, str(config.fitness_function), int(config.num_variables), int(bool(config.maximization)),
+                 json.dumps(config_dict, sort_keys=True))
+            )
+        return self.connection.execute("SELECT id FROM configs WHERE config_hash = ?", (digest,)).fetchone()[0]
+
+    def start_run(self, config):
+        """Create a run record and return its id."""
+        config_id = self.add_config(config)
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (config_id, started_at) VALUES (?, ?)",
+                (config_id, datetime.now().isoformat(timespec='seconds'))
+            )
+        return cursor.lastrowid
+
+    def add_epochs(self, run_id, rows, num_variables):
+        """Bulk-insert progress rows of a run in a single transaction."""
+        best_index = 3 + num_variables
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO epochs (run_id, epoch, population_size, current_best_fitness, current_best_variables, "
+                "best_fitness, best_variables) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((run_id, int(row[0]), int(row[1]), float(row[2]), _variables_blob(row[3:best_index]),
+                  float(row[best_index]), _variables_blob(row[best_index + 1:])) for row in rows)
+            )
+
+    def finish_run(self, run_id, epochs, final_fitness, final_variables, stop_reason=None):
+        """Store the final results of a run."""
+        with self.connection:
+            self.connection.execute(
+                "UPDATE runs SET finished_at = ?, epochs = ?, final_fitness = ?, final_variables = ?, stop_reason = ? "
+                "WHERE id = ?",
+                (datetime.now().isoformat(timespec='seconds'), epochs, final_fitness,
+                 _variables_blob(final_variables) if final_variables is not None else None, stop_reason, run_id)
+            )
+
+    def save_run(self, config, rows, stop_reason=None):
+        """Store a complete run (configuration, every epoch and final results) at once."""
+        run_id = self.start_run(config)
+        self.add_epochs(run_id, rows, config.num_variables)
+        if rows:
+            best_index = 3 + config.num_variables
+            self.finish_run(run_id, len(rows), rows[-1][best_index], rows[-1][best_index + 1:], stop_reason)
+        return run_id
+
+    def best_run(self, fitness_function, num_variables=None, maximization=False):
+        """Best finished run for a fitness function (and optionally a number of variables)."""
+        query = ("SELECT runs.*, configs.config_json FROM runs JOIN configs ON configs.id = runs.config_id "
+                 "WHERE configs.fitness_function = ? AND configs.maximization = ? AND runs.final_fitness IS NOT NULL")
+        params = [fitness_function, int(bool(maximization))]
+        if num_variables is not None:
+            query += " AND configs.num_variables = ?"
+            params.append(num_variables)
+        query += f" ORDER BY runs.final_fitness {'DESC' if maximization else 'ASC'} LIMIT 1"
+        row = self.connection.execute(query, params).fetchone()
+        return self._run_dict(row) if row is not None else None
+
+    def runs_for_config(self, config):
+        """All runs of this configuration (matched by the hash of its problem and operator parameters)."""
+        rows = self.connection.execute(
+            "SELECT runs.*, configs.config_json FROM runs JOIN configs ON configs.id = runs.config_id "
+            "WHERE configs.config_hash = ? ORDER BY runs.id",
+            (config_hash(config_to_dict(config)),)
+        ).fetchall()
+        return [self._run_dict(row) for row in rows]
+
+    def epochs(self, run_id):
+        """Progress rows of a run in the GeneticAlgorithm.progress_data format."""
+        rows = self.connection.execute(
+            "SELECT * FROM epochs WHERE run_id = ? ORDER BY epoch", (run_id,)
+        ).fetchall()
+        return [[row['epoch'], row['population_size'], row['current_best_fitness'],
+                 *_variables_from_blob(row['current_best_variables']), row['best_fitness'],
+                 *_variables_from_blob(row['best_variables'])] for row in rows]
+
+    @staticmethod
+    def _run_dict(row):
+        run = dict(row)
+        run['final_variables'] = _variables_from_blob(run['final_variables'])
+        run['config'] = json.loads(run.pop('config_json'))
+        return run
+
+class RunDatabaseSink:
+    """
+    Results sink storing a run in a RunDatabase; epochs are inserted in batches of flush_every rows.
+    """
+
+    def __init__(self, database, config, flush_every=1000):
+        self.database = database
+        self.num_variables = config.num_variables
+        self.flush_every = flush_every
+        self.run_id = database.start_run(config)
+        self.buffer = []
+        self.epochs = 0
+        self.last_row = None
+        self.metadata = {}
+        self.closed = False
+
+    def write(self, row):
+        self.buffer.append(row)
+        self.last_row = row
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.database.add_epochs(self.run_id, self.buffer, self.num_variables)
+            self.epochs += len(self.buffer)
+            self.buffer = []
+
+    def set_metadata(self, key, value):
+        """Store an additional value; 'stop_reason' is saved with the run."""
+        self.metadata[key] = value
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        if self.last_row is not None:
+            best_index = 3 + self.num_variables
+            self.database.finish_run(self.run_id, self.epochs, self.last_row[best_index],
+                                     self.last_row[best_index + 1:], self.metadata.get('stop_reason'))
+        self.closed = True
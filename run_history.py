@@ -0,0 +1,166 @@
+"""
+Columnar binary run-history format.
+
+A run is stored as a directory with one .npy file per field and a small
+header.json holding the GeneticAlgorithmConfig. The .npy files can be
+memory-mapped, so loading a run for plotting or analysis reads only the
+columns that are actually used.
+
+Usage (CSV export): python run_history.py RUN_DIRECTORY OUTPUT_CSV
+"""
+import csv
+import json
+import os
+import sys
+import numpy as np
+from results_io import results_headers, config_to_dict
+
+HEADER_FILE = "header.json"
+NPY_HEADER_SIZE = 128
+
+# Pola zapisywane w osobnych plikach: nazwa -> typ danych (zmienne mają kształt (epoki, num_variables))
+FIELDS = {
+    'epoch': np.int64,
+    'population_size': np.int64,
+    'current_best_fitness': np.float64,
+    'current_best_variables': np.float64,
+    'best_fitness': np.float64,
+    'best_variables': np.float64,
+}
+
+def _write_npy_header(file, dtype, shape):
+    """
+    Write a fixed-size .npy (version 1.0) header, so it can be rewritten in place as rows are appended.
+    """
+    header = repr({'descr': np.dtype(dtype).str, 'fortran_order': False, 'shape': shape})
+    padding = NPY_HEADER_SIZE - 10 - len(header) - 1
+    file.seek(0)
+    file.write(b'\x93NUMPY\x01\x00')
+    file.write((NPY_HEADER_SIZE - 10).to_bytes(2, 'little'))
+    file.write((header + ' ' * padding + '\n').encode('latin1'))
+
+class ColumnarResultsSink:
+    """
+    Results sink writing each field of the progress rows to its own .npy file.
+    Rows are buffered and appended in batches; file headers are updated on every flush,
+    so the files stay loadable even if the run is interrupted.
+    """
+
+    def __init__(self, directory, config, flush_every=100):
+        self.directory = directory
+        self.num_variables = config.num_variables
+        self.flush_every = flush_every
+        self.buffer = []
+        self.epochs = 0
+        os.makedirs(directory, exist_ok=True)
+        self.header = {'config': config_to_dict(config), 'num_variables': self.num_variables,
+                       'fields': list(FIELDS), 'epochs': 0}
+        self._write_header()
+        self.files = {}
+        for field, dtype in FIELDS.items():
+            file = open(os.path.join(directory, f"{field}.npy"), 'w+b')
+            _write_npy_header(file, dtype, self._shape(field, 0))
+            self.files[field] = file
+
+    def _shape(self, field, epochs):
+        return (epochs, self.num_variables) if field.endswith('_variables') else (epochs,)
+
+    def _write_header(self):
+        with open(os.path.join(self.directory, HEADER_FILE), 'w') as file:
+            json.dump(self.header, file, indent=4)
+
+    def write(self, row):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        rows = np.asarray(self.buffer, dtype=np.float64)
+        best_index = 3 + self.num_variables
+        columns = {
+            'epoch': rows[:, 0],
+            'population_size': rows[:, 1],
+            'current_best_fitness': rows[:, 2],
+            'current_best_variables': rows[:, 3:best_index],
+            'best_fitness': rows[:, best_index],
+            'best_variables': rows[:, best_index + 1:],
+        }
+        self.epochs += len(rows)
+        for field, file in self.files.items():
+            file.seek(0, os.SEEK_END)
+            file.write(np.ascontiguousarray(columns[field], dtype=FIELDS[field]).tobytes())
+            _write_npy_header(file, FIELDS[field], self._shape(field, self.epochs))
+            file.flush()
+        self.buffer.clear()
+        self.header['epochs'] = self.epochs
+        self._write_header()
+
+    def set_metadata(self, key, value):
+        """Store an additional value (e.g. the stop reason) in header.json."""
+        self.header[key] = value
+        self._write_header()
+
+    def close(self):
+        if self.files:
+            self.flush()
+            for file in self.files.values():
+                file.close()
+            self.files = {}
+
+class RunHistory:
+    """
+    Run stored in the columnar format. Columns are memory-mapped lazily on first access.
+    """
+
+    def __init__(self, directory, mmap=True):
+        self.directory = directory
+        self.mmap_mode = 'r' if mmap else None
+        with open(os.path.join(directory, HEADER_FILE), 'r') as file:
+            self.header = json.load(file)
+        self.config = self.header['config']
+        self.num_variables = self.header['num_variables']
+        self.columns = {}
+
+    def __len__(self):
+        return self.header['epochs']
+
+    def __getitem__(self, field):
+        if field not in FIELDS:
+            raise KeyError(f"Unknown run history field: {field}")
+        if field not in self.columns:
+            self.columns[field] = np.load(os.path.join(self.directory, f"{field}.npy"), mmap_mode=self.mmap_mode)
+        return self.columns[field]
+
+    def rows(self, start=0, stop=None):
+        """Progress rows in the GeneticAlgorithm.progress_data format."""
+        stop = len(self) if stop is None else stop
+        columns = [self['epoch'][start:stop, None], self['population_size'][start:stop, None],
+                   self['current_best_fitness'][start:stop, None], self['current_best_variables'][start:stop],
+                   self['best_fitness'][start:stop, None], self['best_variables'][start:stop]]
+        for row in zip(*[column.tolist() for column in columns]):
+            yield [value for part in row for value in part]
+
+def load_run(directory, mmap=True):
+    """
+    Load a run written by ColumnarResultsSink.
+    """
+    return RunHistory(directory, mmap)
+
+def export_csv(directory, csv_path, chunk_size=10000):
+    """
+    Convert a columnar run to the results CSV format used by the GUI.
+    """
+    run = load_run(directory)
+    with open(csv_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(results_headers(run.num_variables))
+        for start in range(0, len(run), chunk_size):
+            writer.writerows(run.rows(start, start + chunk_size))
+    return csv_path
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        raise SystemExit("Usage: python run_history.py RUN_DIRECTORY OUTPUT_CSV")
+    export_csv(sys.argv[1], sys.argv[2])
@@ -1,81 +1,168 @@
 import numpy as np
+from random_streams import ensure_rng
 
-def select_best(population, num_to_select, maximization=False):
+def select_best(fitness, num_to_select, maximization=False):
     """
     Select the best individuals based on their fitness scores.
+    Uses a partial sort (argpartition), only the selected individuals are sorted.
+    Returns the row indices of the selected individuals, best first.
     """
-    # log(f"Performing best selection: selecting {num_to_select} from population of {len(population)}")
-    sorted_population = sorted(population, key=lambda x: x.fitness, reverse=maximization)
-    selected = sorted_population[:num_to_select]
-    # log(f"Selected {len(selected)} best individuals. Top fitness: {selected[0].fitness if selected else 'N/A'}")
-    return selected
+    scores = -fitness if maximization else fitness
+    if num_to_select < len(scores):
+        top = np.argpartition(scores, num_to_select - 1)[:num_to_select]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(scores[top], kind='stable')]
 
-def roulette_wheel_selection(population, num_to_select, maximization=False):
+def selection_weights(fitness, maximization=False, scaling='linear'):
     """
-    Roulette wheel selection method.
-    Probability of selection is proportional to the fitness.
+    Non-negative selection weights for fitness-proportional selection.
+    'linear' uses the fitness values directly (for minimization transformed as max_fitness - fitness),
+    'rank' uses ranks (worst individual 1, best N), which does not depend on the fitness scale.
     """
+    if scaling == 'rank':
+        order = np.argsort(fitness if maximization else -fitness, kind='stable')
+        weights = np.empty(len(fitness))
+        weights[order] = np.arange(1, len(fitness) + 1)
+        return weights
+    elif scaling != 'linear':
+        raise ValueError(f"Unknown selection scaling: {scaling}")
+    
     # For minimization problems, we need to transform the fitness values
     # since lower values are better but we need higher probabilities
     if not maximization:
-        max_fitness = max(ind.fitness for ind in population)
-        min_fitness = min(ind.fitness for ind in population)
+        max_fitness = np.max(fitness)
+        min_fitness = np.min(fitness)
         
         # If all fitness values are the same, use equal probabilities
         if max_fitness == min_fitness:
-            selection_probs = [1.0/len(population) for _ in population]
-        else:
-            # Transform fitness: higher values for lower fitness
-            # Adding a small epsilon to avoid issues with identical fitness values
-            epsilon = 1e-10
-            transformed_fitness = [max_fitness - ind.fitness + epsilon for ind in population]
-            total_transformed = sum(transformed_fitness)
-            selection_probs = [tf/total_transformed for tf in transformed_fitness]
-    else:
-        # For maximization, higher fitness should get higher probability
-        total_fitness = sum(ind.fitness for ind in population)
-        
-        # Handle the case where all fitness values might be zero
-        if total_fitness == 0:
-            selection_probs = [1.0/len(population) for _ in population]
-        else:
-            selection_probs = [ind.fitness/total_fitness for ind in population]
+            return np.ones(len(fitness))
+        # Transform fitness: higher values for lower fitness
+        # Adding a small epsilon to avoid issues with identical fitness values
+        epsilon = 1e-10
+        return max_fitness - fitness + epsilon
     
-    # Perform selection
-    selected_individuals = np.random.choice(population, num_to_select, replace=False, p=selection_probs)
+    # For maximization, higher fitness should get higher probability (negative values are shifted)
+    weights = fitness - min(0.0, np.min(fitness))
     
-    return list(selected_individuals)
+    # Handle the case where all fitness values might be zero
+    if np.sum(weights) == 0:
+        return np.ones(len(fitness))
+    return weights
+
+def stochastic_universal_sampling(weights, num_to_select, rng=None):
+    """
+    Stochastic universal sampling: one random offset and num_to_select equally spaced pointers
+    over the cumulative weights. O(N) work plus a binary search per pointer.
+    """
+    cumulative = np.cumsum(weights)
+    step = cumulative[-1] / num_to_select
+    pointers = ensure_rng(rng).uniform(0, step) + step * np.arange(num_to_select)
+    return np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(weights) - 1)
+
+class AliasTable:
+    """
+    Walker's alias table for O(1) weighted draws; build it once and call sample() for repeated draws.
+    Built in O(N log N) with vectorized prefix sums (a sweep over light and heavy columns)
+    instead of Vose's item-by-item loop.
+    """
 
-def tournament_selection(population, num_to_select, tournament_size, maximization=False):
+    def __init__(self, weights):
+        n = len(weights)
+        scaled = np.asarray(weights, dtype=np.float64) * n / np.sum(weights)
+        self.probability = np.ones(n)
+        self.alias = np.arange(n)
+        light = np.flatnonzero(scaled < 1.0)
+        heavy = np.flatnonzero(scaled >= 1.0)
+        if len(light) == 0 or len(heavy) == 0:
+            return
+        # Kolumny lekkich osobników dopełniane są kolejno przez bieżącego ciężkiego dawcę; dawca j obsługuje
+        # lekkie kolumny, dopóki suma niedoborów przed nimi nie przekroczy łącznej nadwyżki dawców 1..j
+        deficit = np.concatenate(([0.0], np.cumsum(1.0 - scaled[light])))
+        surplus = np.cumsum(scaled[heavy] - 1.0)
+        donors = np.minimum(np.searchsorted(surplus, deficit[:-1], side='left'), len(heavy) - 1)
+        self.probability[light] = scaled[light]
+        self.alias[light] = heavy[donors]
+        # Wyczerpany dawca (poniżej 1) staje się lekką kolumną dopełnianą przez następnego dawcę
+        exhausted = np.searchsorted(deficit, surplus[:-1], side='right')
+        drained = np.flatnonzero(exhausted < len(deficit))
+        self.probability[heavy[drained]] = np.clip(1.0 + surplus[drained] - deficit[exhausted[drained]], 0.0, 1.0)
+        self.alias[heavy[drained]] = heavy[drained + 1]
+
+    def sample(self, num_to_select, rng=None):
+        rng = ensure_rng(rng)
+        columns = rng.integers(0, len(self.probability), num_to_select)
+        return np.where(rng.random(num_to_select) < self.probability[columns], columns, self.alias[columns])
+
+def roulette_wheel_selection(fitness, num_to_select, maximization=False, sampler='sus', scaling='linear', rng=None):
+    """
+    Roulette wheel selection method.
+    Probability of selection is proportional to the (linearly or rank-scaled) fitness.
+    Individuals are drawn with stochastic universal sampling ('sus') or from an alias table ('alias').
+    For a single batch of draws per generation 'sus' is cheaper; keep an AliasTable for repeated draws.
+    Returns the row indices of the selected individuals.
+    """
+    weights = selection_weights(fitness, maximization, scaling)
+    if sampler == 'sus':
+        return stochastic_universal_sampling(weights, num_to_select, rng)
+    elif sampler == 'alias':
+        return AliasTable(weights).sample(num_to_select, rng)
+    else:
+        raise ValueError(f"Unknown roulette sampler: {sampler}")
+
+def distinct_draws(population, count, size, rng=None):
+    """
+    `count` rows of `size` distinct indices from range(population), each row a uniform random subset
+    (Floyd's algorithm, vectorized over rows; O(count * size^2) work independent of the population).
+    """
+    rng = ensure_rng(rng)
+    draws = np.empty((count, size), dtype=np.int64)
+    for column, upper in enumerate(range(population - size, population)):
+        candidate = rng.integers(0, upper + 1, count)
+        taken = (draws[:, :column] == candidate[:, None]).any(axis=1)
+        draws[:, column] = np.where(taken, upper, candidate)
+    return draws
+
+def tournament_selection(fitness, num_to_select, tournament_size, maximization=False, rng=None):
     """
     Tournament selection method.
-    Divides population into k-element subgroups (tournament_size) and selects the best individual from each subgroup.
+    All tournaments of a round are drawn at once as an index matrix (tournaments x tournament_size)
+    of distinct individuals still available, and winners are found with argmin/argmax along the rows.
+    Winners are masked out of the pool (selection without replacement); tournaments that picked
+    an already selected winner are repeated in the next round.
+    Returns the row indices of the selected individuals.
     """
     # Ensure tournament size doesn't exceed population size
-    actual_tournament_size = min(tournament_size, len(population))
+    actual_tournament_size = min(tournament_size, len(fitness))
     
     # Check if we have enough individuals to select
-    if num_to_select > len(population):
+    if num_to_select > len(fitness):
         raise ValueError("num_to_select cannot be greater than population size")
     
-    selected_individuals = []
-    population_copy = population.copy()  # Work on a copy to preserve original population
+    rng = ensure_rng(rng)
+    # Lower score is better in both modes
+    scores = -fitness if maximization else fitness
+    available = np.ones(len(fitness), dtype=np.bool_)
+    selected = []
+    remaining_to_select = num_to_select
     
-    while len(selected_individuals) < num_to_select and population_copy:
-        # Randomly select tournament participants
-        if len(population_copy) <= actual_tournament_size:
-            tournament_participants = population_copy
-        else:
-            tournament_participants = np.random.choice(population_copy, actual_tournament_size, replace=False)
-            
-        # Find the best individual in the tournament
-        if maximization:
-            winner = max(tournament_participants, key=lambda ind: ind.fitness)
-        else:
-            winner = min(tournament_participants, key=lambda ind: ind.fitness)
+    while remaining_to_select > 0:
+        candidates = np.flatnonzero(available)
+        if len(candidates) <= actual_tournament_size:
+            # The whole remaining pool forms the tournament, the best ones win in order
+            order = candidates[np.argsort(scores[candidates], kind='stable')]
+            selected.append(order[:remaining_to_select])
+            break
+        
+        # Draw all tournaments of this round at once (distinct players within a tournament) and find their winners
+        participants = candidates[distinct_draws(len(candidates), remaining_to_select, actual_tournament_size, rng)]
+        winners = participants[np.arange(remaining_to_select), np.argmin(scores[participants], axis=1)]
         
-        selected_individuals.append(winner)
-        population_copy.remove(winner)
+        # Keep each winner once (in order of first win) and remove it from the pool
+        _, first_index = np.unique(winners, return_index=True)
+        winners = winners[np.sort(first_index)]
+        selected.append(winners)
+        available[winners] = False
+        remaining_to_select -= len(winners)
     
-    return selected_individuals
-  
+    return np.concatenate(selected) if selected else np.empty(0, dtype=np.intp)
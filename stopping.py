@@ -0,0 +1,53 @@
+import time
+
+class StoppingCriteria:
+    """
+    Termination criteria checked after every epoch, in addition to the fixed number of epochs:
+    stagnation of the best-ever fitness, reaching a target fitness, a maximum number of
+    fitness evaluations and a wall-clock time budget. Disabled criteria are set to 0 or None.
+    check() returns the reason for stopping ('target', 'stagnation', 'max_evaluations',
+    'time_budget') or None to continue.
+    """
+
+    def __init__(self, config):
+        self.maximization = config.maximization
+        self.stagnation_epochs = config.stagnation_epochs
+        self.stagnation_tolerance = config.stagnation_tolerance
+        self.target_fitness = config.target_fitness
+        self.target_epsilon = config.target_epsilon
+        self.max_evaluations = config.max_evaluations
+        self.time_budget = config.time_budget
+        self.reset()
+
+    def reset(self):
+        """Start measuring a new run (time budget and stagnation window)."""
+        self.start_time = time.perf_counter()
+        self.reference_fitness = None
+        self.stagnant_epochs = 0
+
+    def is_better(self, fitness, reference, tolerance=0.0):
+        return fitness - reference > tolerance if self.maximization else reference - fitness > tolerance
+
+    def check(self, best_fitness, evaluations):
+        if self.target_fitness is not None:
+            # Cel osiągnięty, gdy najlepsze rozwiązanie jest w odległości epsilon od celu (lub go przekracza)
+            if not self.is_better(self.target_fitness, best_fitness, self.target_epsilon):
+                return 'target'
+
+        if self.stagnation_epochs:
+            # Poprawa liczona względem wartości z ostatniej poprawy, więc drobne zmiany poniżej tolerancji się sumują
+            if self.reference_fitness is None or self.is_better(best_fitness, self.reference_fitness, self.stagnation_tolerance):
+                self.reference_fitness = best_fitness
+                self.stagnant_epochs = 0
+            else:
+                self.stagnant_epochs += 1
+                if self.stagnant_epochs >= self.stagnation_epochs:
+                    return 'stagnation'
+
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return 'max_evaluations'
+
+        if self.time_budget is not None and time.perf_counter() - self.start_time >= self.time_budget:
+            return 'time_budget'
+
+        return None
@@ -1,19 +1,22 @@
 import time
+import logging
 import os
 import subprocess
 import platform
-import json
 from PyQt5.QtWidgets import (QFileDialog, QMainWindow, QLabel, QVBoxLayout, QHBoxLayout, QWidget, 
-                           QStackedWidget, QApplication, QPushButton, QFrame, QGridLayout, 
+                           QStackedWidget, QPushButton, QFrame, QGridLayout, 
                            QMessageBox, QGroupBox, QScrollArea, QFormLayout)
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, QThread
 from PyQt5.QtGui import QFont
 from form import ConfigForm, get_config_params_from_gui
 from configuration import config
 from genetic_algorithm import GeneticAlgorithm
 from logger import log
 from plotter import PlotWidget
-import csv
+from worker import GeneticAlgorithmWorker
+from results_io import write_config_json, load_config_json
+from results_sink import CsvResultsSink
+from run_database import RunDatabase, RunDatabaseSink
 
 class ConfigDisplayWidget(QFrame):
     """Widget to display the current configuration parameters"""
@@ -60,7 +63,9 @@ class ConfigDisplayWidget(QFrame):
             "Problem Definition": ["fitness_function", "lower_bound", "upper_bound", 
                                  "precision", "num_variables"],
             "Population Settings": ["population_size", "epochs_num", "elite_strategy_amount", 
-                                  "maximization"],
+                                  "maximization", "generation_model", "steady_state_replacement", "seed"],
+            "Stopping Criteria": ["stagnation_epochs", "stagnation_tolerance", "target_fitness",
+                                  "target_epsilon", "max_evaluations", "time_budget"],
             "Genetic Operations": ["crossover_probability", "mutation_probability", 
                                  "inversion_probability"],
             "Selection Method": ["selection_method", "select_best_amount", "select_tournament_size"],
@@ -176,6 +181,50 @@ class VariablesWidget(QFrame):
             self.grid.addWidget(StyledLabel(f"X{i+1}:", self, bold=True), i+1, 0)
             self.grid.addWidget(StyledLabel(f"{var:.6f}", self), i+1, 1)
 
+class TimingWidget(QFrame):
+    """Breakdown of the computation time per algorithm phase"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFrameStyle(QFrame.Panel | QFrame.Raised)
+        self.setLineWidth(2)
+        
+        self.layout = QVBoxLayout(self)
+        
+        # Title for the breakdown
+        self.title = StyledLabel("Time Breakdown", self, bold=True, font_size=14, align=Qt.AlignCenter)
+        self.layout.addWidget(self.title)
+        
+        # Grid with one row per phase
+        self.grid = QGridLayout()
+        self.layout.addLayout(self.grid)
+        self.reset()
+    
+    def reset(self):
+        """Remove the timing data of a previous run"""
+        self._clear()
+        self.grid.addWidget(StyledLabel("No data yet", self), 0, 0)
+    
+    def _clear(self):
+        for i in reversed(range(self.grid.count())):
+            self.grid.itemAt(i).widget().setParent(None)
+    
+    def update_timing(self, summary):
+        """Update the displayed breakdown from GeneticAlgorithm.timing_summary()"""
+        self._clear()
+        for column, header in enumerate(["Phase", "Total", "Share", "Last epoch"]):
+            self.grid.addWidget(StyledLabel(header, self, bold=True), 0, column)
+        
+        for row, (phase, data) in enumerate(summary['phases'].items(), start=1):
+            self.grid.addWidget(StyledLabel(phase, self, bold=True), row, 0)
+            self.grid.addWidget(StyledLabel(f"{data['time']:.3f} s", self), row, 1)
+            self.grid.addWidget(StyledLabel(f"{data['share']:.1%}", self), row, 2)
+            self.grid.addWidget(StyledLabel(f"{data['last_epoch_time'] * 1000:.2f} ms", self), row, 3)
+        
+        row = len(summary['phases']) + 1
+        if summary['evaluations_per_second'] is not None:
+            self.grid.addWidget(StyledLabel("Evaluations/s:", self, bold=True), row, 0)
+            self.grid.addWidget(StyledLabel(f"{summary['evaluations_per_second']:.0f}", self), row, 1, 1, 3)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -242,6 +291,10 @@ class MainWindow(QMainWindow):
         self.config_display = ConfigDisplayWidget()
         right_column.addWidget(self.config_display)
         
+        # Add time breakdown per algorithm phase
+        self.timing_widget = TimingWidget()
+        right_column.addWidget(self.timing_widget)
+        
         # Add columns to container
         columns_layout.addLayout(left_column, 2)  # 2:1 ratio (plot gets more space)
         columns_layout.addLayout(right_column, 1)
@@ -262,6 +315,17 @@ class MainWindow(QMainWindow):
         self.back_button.clicked.connect(self.show_form)
         buttons_layout.addWidget(self.back_button)
         
+        # Add pause/resume and cancel buttons (enabled only while running)
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+        buttons_layout.addWidget(self.pause_button)
+        
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_algorithm)
+        self.cancel_button.setEnabled(False)
+        buttons_layout.addWidget(self.cancel_button)
+        
         # Add open file button
         self.open_results_file_button = QPushButton("Open results file")
         self.open_results_file_button.clicked.connect(self.open_results_file)
@@ -290,12 +354,16 @@ class MainWindow(QMainWindow):
         
         # Initialize GA and results
         self.ga = None
-        self.results = []
+        self.database = None
         self.start_time = 0
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_display)
         self.current_epoch = 0
         
+        # Worker running the algorithm on a separate thread
+        self.worker = None
+        self.worker_thread = None
+        
         # Results file path
         self.results_file_path = None
         self.plot_file_path = None
@@ -330,18 +398,7 @@ class MainWindow(QMainWindow):
         config_file_path = os.path.join(results_dir, json_filename)
         
         # Save the configuration
-        with open(config_file_path, 'w') as file:
-            # Convert any non-serializable types (like numpy values) to native Python types
-            config_dict = {}
-            for key, value in self.config_params.items():
-                if isinstance(value, bool) or isinstance(value, str):
-                    config_dict[key] = value
-                elif isinstance(value, (int, float)):
-                    config_dict[key] = float(value)
-                else:
-                    config_dict[key] = str(value)
-                
-            json.dump(config_dict, file, indent=4)
+        write_config_json(config_file_path, self.config_params)
         
         return config_file_path
 
@@ -360,8 +417,7 @@ class MainWindow(QMainWindow):
             
         try:
             # Load the configuration from the file
-            with open(file_path, 'r') as file:
-                config_params = json.load(file)
+            config_params = load_config_json(file_path)
             
             # Update the form with loaded values
             self.populate_form_from_config(config_params)
@@ -408,6 +464,29 @@ class MainWindow(QMainWindow):
         if 'maximization' in config_params:
             form.maximization_check.setChecked(config_params['maximization'])
         
+        if 'generation_model' in config_params:
+            index = form.generation_model_combo.findText(config_params['generation_model'])
+            if index >= 0:
+                form.generation_model_combo.setCurrentIndex(index)
+        
+        if 'steady_state_replacement' in config_params:
+            form.steady_state_replacement_spin.setValue(int(config_params['steady_state_replacement']))
+        
+        if 'seed' in config_params:
+            form.seed_input.setText('' if config_params['seed'] is None else str(config_params['seed']))
+        
+        # Stopping Criteria
+        if 'stagnation_epochs' in config_params:
+            form.stagnation_epochs_spin.setValue(int(config_params['stagnation_epochs']))
+        
+        for key, field in [('stagnation_tolerance', form.stagnation_tolerance_input),
+                           ('target_fitness', form.target_fitness_input),
+                           ('target_epsilon', form.target_epsilon_input),
+                           ('max_evaluations', form.max_evaluations_input),
+                           ('time_budget', form.time_budget_input)]:
+            if key in config_params:
+                field.setText('' if config_params[key] is None else str(config_params[key]))
+        
         # Genetic Operations
         if 'crossover_probability' in config_params:
             form.crossover_prob_spin.setValue(float(config_params['crossover_probability']))
@@ -447,8 +526,9 @@ class MainWindow(QMainWindow):
         
         # Reset plot, timer and status
         self.timer_widget.update_time(0)
-        self.plot_widget.axes.clear()
-        self.plot_widget.canvas.draw()
+        self.plot_widget.reset_plot()
+        self.timing_widget.reset()
+        self.status_label.setStyleSheet("color: #5eead4; font-weight: bold; font-size: 14px; padding: 10px;")
         self.status_label.setText("")
         
         # Disable the buttons while running
@@ -460,76 +540,157 @@ class MainWindow(QMainWindow):
         self.config_params = get_config_params_from_gui(self.config_form)
         if self.config_params:
             config.update_from_dict(self.config_params)
-        log(f"Configuration:\n{config}")
+        log("Configuration:\n%s", config)
         
         # Update the config display with the current parameters
         self.config_display.update_config(self.config_params)
                 
+        # Progress rows are streamed to the results file and the run database as epochs finish,
+        # so only the last epoch is kept in memory (the plot keeps its own series)
+        config.progress_history = 1
+        results_dir = os.path.abspath('./results')
+        os.makedirs(results_dir, exist_ok=True)
+        self.timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
+        self.results_file_path = os.path.join(results_dir, f"results-{self.timestamp}.csv")
+        self.database = RunDatabase(os.path.join(results_dir, 'runs.db'), check_same_thread=False)
+        sinks = [CsvResultsSink(self.results_file_path, config.num_variables),
+                 RunDatabaseSink(self.database, config)]
+        
         # Create genetic algorithm instance
-        self.ga = GeneticAlgorithm(config)
+        self.ga = GeneticAlgorithm(config, sinks=sinks)
         
         # Initialize variables
-        self.results = []
         self.current_epoch = 0
         self.start_time = time.time()
         
         # Start the timer for updates
         self.update_timer.start(100)  # Update every 100ms
         
-        # Process events to update UI before starting algorithm
-        QApplication.processEvents()
-        
-        # Run algorithm in batches to keep UI responsive
-        self.run_next_epoch()
+        # Run the algorithm on a worker thread; progress arrives through queued signals
+        self.worker_thread = QThread()
+        self.worker = GeneticAlgorithmWorker(self.ga, config.epochs_num)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.timing.connect(self.timing_widget.update_timing)
+        self.worker.error.connect(self.on_algorithm_error)
+        self.worker.finished.connect(self.on_algorithm_finished)
+        self.worker.finished.connect(self.worker_thread.quit)
+        self.worker_thread.finished.connect(self.on_thread_finished)
+        
+        self.back_button.setEnabled(False)
+        self.pause_button.setText("Pause")
+        self.pause_button.setEnabled(True)
+        self.cancel_button.setEnabled(True)
+        
+        self.worker_thread.start()
+        
+    def on_progress(self, rows):
+        """Receive new progress rows from the worker thread and refresh the view"""
+        self.current_epoch += len(rows)
+        
+        latest_data = rows[-1]
+        current_fitness = latest_data[2]  # Current best fitness
+        variables = latest_data[3:3+config.num_variables]  # Extract variables from data
+        self.variables_widget.update_variables(current_fitness, variables)
+        
+        # Append only the new epochs to the plot
+        self.plot_widget.append_results(rows)
+    
+    def toggle_pause(self):
+        """Pause or resume the running algorithm"""
+        if not self.worker:
+            return
+        if self.worker.is_paused():
+            self.worker.resume()
+            self.pause_button.setText("Pause")
+        else:
+            self.worker.pause()
+            self.pause_button.setText("Resume")
+    
+    def cancel_algorithm(self):
+        """Stop the running algorithm after the current epoch"""
+        if self.worker:
+            self.cancel_button.setEnabled(False)
+            self.pause_button.setEnabled(False)
+            self.worker.cancel()
+    
+    def on_algorithm_error(self, message):
+        log("Algorithm failed: %s", message, level=logging.ERROR)
+        QMessageBox.critical(self, "Algorithm Error", f"The algorithm failed: {message}")
+    
+    def on_algorithm_finished(self, stop_reason):
+        # Algorithm completed, stopped early by a stopping criterion, cancelled or failed
+        completed = stop_reason not in ('cancelled', 'error')
+        self.update_timer.stop()
+        self.back_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
         
-    def run_next_epoch(self):
-        if self.current_epoch < config.epochs_num:
-            # Run a single iteration
-            self.ga.iteration(self.current_epoch)
-            self.current_epoch += 1
-            
-            # Update display
-            self.update_display()
-            
-            # Schedule next iteration
-            QTimer.singleShot(1, self.run_next_epoch)
+        elapsed_time = time.time() - self.start_time
+        self.timer_widget.update_time(elapsed_time)
+        if completed:
+            log("Algorithm completed in %.2f seconds (%s)", elapsed_time, stop_reason)
         else:
-            # Algorithm completed
-            self.update_timer.stop()
-            elapsed_time = time.time() - self.start_time
-            log(f"Algorithm completed in {elapsed_time:.2f} seconds")
-            
-            # Ensure the results directory exists
-            results_dir = os.path.abspath('./results')
-            os.makedirs(results_dir, exist_ok=True)
-            
-            # Generate a timestamped filename
-            timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
-            
-            # Save results to CSV
-            csv_filename = f"results-{timestamp}.csv"
-            self.results_file_path = os.path.join(results_dir, csv_filename)
-            self.save_results_to_csv()
-            
-            # Save plot to image file
-            plot_filename = f"plot-{timestamp}.png"
-            self.plot_file_path = os.path.join(results_dir, plot_filename)
-            self.plot_widget.save_plot(self.plot_file_path)
-            
-            # Save configuration to JSON file
-            self.config_file_path = self.save_config_to_json()
-            
-            # Show a popup message with the results
-            self.show_popup_message(elapsed_time)
-            
-            # Show completion message
-            self.status_label.setStyleSheet("color: #5eead4; font-weight: bold; font-size: 14px; padding: 10px;")
+            log("Algorithm stopped after %d epochs (%.2f seconds)", self.current_epoch, elapsed_time)
+        
+        # The worker has already flushed and closed the results sinks (CSV file and run database)
+        self.database.close()
+        self.database = None
+        
+        if stop_reason == 'error':
+            # Failed run: no plot/config export and no success popup; epochs finished so far are in the results file
+            self.status_label.setStyleSheet("color: #ff66b3; font-weight: bold; font-size: 14px; padding: 10px;")
+            if self.current_epoch == 0:
+                self.status_label.setText("Optimization failed before the first epoch.")
+            else:
+                self.status_label.setText(f"Optimization failed after {self.current_epoch} epochs - partial results saved.")
+                self.open_results_file_button.setEnabled(True)
+            return
+        
+        if self.current_epoch == 0:
+            self.status_label.setText("Optimization cancelled before the first epoch.")
+            return
+        
+        # Save plot to image file
+        plot_filename = f"plot-{self.timestamp}.png"
+        self.plot_file_path = os.path.join(os.path.dirname(self.results_file_path), plot_filename)
+        self.plot_widget.save_plot(self.plot_file_path)
+        
+        # Save configuration to JSON file
+        self.config_file_path = self.save_config_to_json()
+        
+        # Show a popup message with the results
+        self.show_popup_message(elapsed_time)
+        
+        # Show completion message
+        self.status_label.setStyleSheet("color: #5eead4; font-weight: bold; font-size: 14px; padding: 10px;")
+        if not completed:
+            self.status_label.setText("Optimization cancelled - partial results saved.")
+        elif stop_reason == 'epochs':
             self.status_label.setText("✓ Optimization complete!")
-            
-            # Enable buttons
-            self.open_results_file_button.setEnabled(True)
-            self.open_config_file_button.setEnabled(True)
-            self.view_plot_button.setEnabled(True)
+        else:
+            self.status_label.setText(f"✓ Optimization stopped early ({stop_reason.replace('_', ' ')}) after {self.current_epoch} epochs.")
+        
+        # Enable buttons
+        self.open_results_file_button.setEnabled(True)
+        self.open_config_file_button.setEnabled(True)
+        self.view_plot_button.setEnabled(True)
+    
+    def on_thread_finished(self):
+        """Release the worker only after its thread has actually stopped"""
+        self.worker = None
+        self.worker_thread = None
+    
+    def closeEvent(self, event):
+        """Stop the worker thread before the window closes"""
+        if self.worker_thread is not None:
+            self.worker.cancel()
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        if self.database is not None:
+            self.database.close()
+        super().closeEvent(event)
     
     def open_results_file(self):
         """Open the results CSV file in the default file explorer"""
@@ -589,62 +750,10 @@ class MainWindow(QMainWindow):
                             f"Could not open the configuration file: {str(e)}")
 
     def update_display(self):
-        # Update timer
+        # Update timer (progress itself is pushed by the worker through on_progress)
         elapsed_time = time.time() - self.start_time
         self.timer_widget.update_time(elapsed_time)
-        
-        # Update variables display if we have data
-        if hasattr(self.ga, 'progress_data') and self.ga.progress_data:
-            latest_data = self.ga.progress_data[-1]
-            current_fitness = latest_data[2]  # Current best fitness
-            
-            num_vars = config.num_variables
-            variables = latest_data[3:3+num_vars]  # Extract variables from data
-            
-            # Update the variables widget
-            self.variables_widget.update_variables(current_fitness, variables)
-        
-        # Update plot with current progress data
-        if hasattr(self.ga, 'progress_data') and self.ga.progress_data:
-            self.plot_widget.update_plot(self.ga.progress_data)
-        
-        # Process UI events
-        QApplication.processEvents()
     
-    def save_results_to_csv(self):
-        """Save results to a CSV file with headers"""
-        if not self.results_file_path:
-            # Generate default path if none was set
-            results_dir = os.path.abspath('./results')
-            os.makedirs(results_dir, exist_ok=True)
-            timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
-            self.results_file_path = os.path.join(results_dir, f"results-{timestamp}.csv")
-        
-        # Save to CSV file with headers
-        with open(self.results_file_path, 'w', newline='') as file:
-            writer = csv.writer(file)
-            
-            # Generate and write headers
-            headers = ["Epoch", "Population Size", "Current Best Fitness"]
-            
-            # Add headers for current epoch's best solution variables
-            for i in range(config.num_variables):
-                headers.append(f"X{i+1}")
-                
-            headers.append("Best Fitness All Time")
-            
-            # Add headers for best solution variables
-            for i in range(config.num_variables):
-                headers.append(f"Best X{i+1}")
-                
-            writer.writerow(headers)
-            
-            # Write the actual data
-            for result in self.ga.progress_data:
-                writer.writerow(result)
-            
-        return self.results_file_path
-                
     def show_popup_message(self, elapsed_time):
         """Show a popup message with the results"""
         msg = f"Algorithm completed in {elapsed_time:.2f} seconds.\n\nBest solution:\n"
@@ -0,0 +1,107 @@
+import time
+from PyQt5.QtCore import QObject, QMutex, QWaitCondition, pyqtSignal, pyqtSlot
+
+class GeneticAlgorithmWorker(QObject):
+    """
+    Runs the genetic algorithm epochs back-to-back on a worker QThread.
+
+    Progress is sent to the GUI through queued signals as snapshots holding
+    the progress rows produced since the previous snapshot. Snapshots are
+    rate-limited, so a fast run does not flood the GUI event loop.
+    pause(), resume() and cancel() are thread-safe and meant to be called
+    directly from the GUI thread.
+    """
+
+    # Lista wierszy nowych epok od poprzedniego wysłania
+    progress = pyqtSignal(list)
+    # Czasy faz algorytmu (GeneticAlgorithm.timing_summary), wysyłane razem z postępem
+    timing = pyqtSignal(dict)
+    # Powód zakończenia: 'epochs', kryterium zatrzymania (GeneticAlgorithm.finish), 'cancelled' lub 'error'
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, ga, epochs_num, snapshot_interval=0.05, parent=None):
+        super().__init__(parent)
+        self.ga = ga
+        self.epochs_num = epochs_num
+        self.snapshot_interval = snapshot_interval
+        self._mutex = QMutex()
+        self._resume_condition = QWaitCondition()
+        self._paused = False
+        self._cancelled = False
+
+    @pyqtSlot()
+    def run(self):
+        pending_rows = []
+        last_snapshot = time.perf_counter()
+        stop_reason = 'epochs'
+        self.ga.stopping.reset()
+        try:
+            for epoch in range(self.epochs_num):
+                if not self._wait_if_paused():
+                    stop_reason = 'cancelled'
+                    break
+                self.ga.iteration(epoch)
+                pending_rows.append(self.ga.last_epoch_data)
+                reason = self.ga.check_stop()
+                if reason is not None:
+                    stop_reason = reason
+                    break
+
+                # Wysyłanie nowych wierszy nie częściej niż co snapshot_interval sekund
+                now = time.perf_counter()
+                if now - last_snapshot >= self.snapshot_interval:
+                    self.progress.emit(pending_rows)
+                    self.timing.emit(self.ga.timing_summary())
+                    pending_rows = []
+                    last_snapshot = now
+
+            if pending_rows:
+                self.progress.emit(pending_rows)
+                pending_rows = []
+            self.timing.emit(self.ga.timing_summary())
+            self.ga.finish(stop_reason)
+            self.ga.log_timing()
+        except Exception as e:
+            self.error.emit(str(e))
+            stop_reason = 'error'
+            # Epoki ukończone przed błędem trafiają do widoku, a powód zatrzymania do wyników
+            if pending_rows:
+                self.progress.emit(pending_rows)
+            self.ga.finish(stop_reason)
+        finally:
+            self.ga.close()
+        self.finished.emit(stop_reason)
+
+    def _wait_if_paused(self):
+        """Block while paused; returns False when the run has been cancelled."""
+        self._mutex.lock()
+        try:
+            while self._paused and not self._cancelled:
+                self._resume_condition.wait(self._mutex)
+            return not self._cancelled
+        finally:
+            self._mutex.unlock()
+
+    def pause(self):
+        self._mutex.lock()
+        self._paused = True
+        self._mutex.unlock()
+
+    def resume(self):
+        self._mutex.lock()
+        self._paused = False
+        self._resume_condition.wakeAll()
+        self._mutex.unlock()
+
+    def cancel(self):
+        self._mutex.lock()
+        self._cancelled = True
+        self._resume_condition.wakeAll()
+        self._mutex.unlock()
+
+    def is_paused(self):
+        self._mutex.lock()
+        paused = self._paused
+        self._mutex.unlock()
+        return paused